@@ -17,6 +17,7 @@
     "data": [
         "security/ir.model.access.csv",
         "security/timesheet_report_security.xml",
+        "data/ir_cron_data.xml",
         "report/timesheet_report_view.xml",
         "views/account_analytic_line_view.xml",
         "views/project_project_view.xml",
@@ -9,7 +9,7 @@ from dateutil.relativedelta import relativedelta
 
 from odoo import api, fields, models
 from odoo.exceptions import UserError
-from odoo.tools.sql import SQL
+from odoo.tools.sql import SQL, create_index
 
 
 class AccountAnalyticLine(models.Model):
@@ -35,6 +35,23 @@ class AccountAnalyticLine(models.Model):
         compute="_compute_is_timer_running",
     )
 
+    def init(self):
+        """Index the timesheet dashboard domains (user/project + date)."""
+        create_index(
+            self.env.cr,
+            "account_analytic_line_user_date_idx",
+            self._table,
+            [SQL("user_id"), SQL("date")],
+            where=SQL("project_id IS NOT NULL"),
+        )
+        create_index(
+            self.env.cr,
+            "account_analytic_line_project_date_idx",
+            self._table,
+            [SQL("project_id"), SQL("date")],
+            where=SQL("project_id IS NOT NULL"),
+        )
+
     @api.depends("unit_amount", "date_time")
     def _compute_is_timer_running(self):
         for record in self:
@@ -136,9 +153,15 @@ class AccountAnalyticLine(models.Model):
             else:
                 self.unit_amount = 0
 
+    def _invalidate_dashboard_cache(self):
+        """Drop the memoized timesheet dashboard payloads."""
+        self.env.registry.clear_cache()
+
     @api.model_create_multi
     def create(self, vals_list):
-        return super().create(list(map(self._eval_date, vals_list)))
+        records = super().create(list(map(self._eval_date, vals_list)))
+        records._invalidate_dashboard_cache()
+        return records
 
     def write(self, vals):
         self_individual = self.env["account.analytic.line"]
@@ -154,12 +177,19 @@ class AccountAnalyticLine(models.Model):
                     )
                 )
                 res_individual |= super(AccountAnalyticLine, record).write(vals)
-        return (
+        result = (
             super(AccountAnalyticLine, self - self_individual).write(
                 self._eval_date(vals)
             )
             and res_individual
         )
+        self._invalidate_dashboard_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self._invalidate_dashboard_cache()
+        return result
 
     def button_resume_work(self):
         """Create a new record starting now, with a running timer."""
@@ -50,15 +50,12 @@ class HrTimesheetTimeControlMixin(models.AbstractModel):
     def _compute_show_time_control(self):
         """Decide which time control button to show, if any."""
         related_field = self._relation_with_timesheet_line()
-        grouped = self.env["account.analytic.line"].read_group(
-            domain=self._timesheet_running_domain(),
-            fields=["id"],
-            groupby=[related_field],
+        grouped = self.env["account.analytic.line"]._read_group(
+            self._timesheet_running_domain(),
+            [related_field],
+            ["__count"],
         )
-        lines_per_record = {
-            group[related_field][0]: group[f"{related_field}_count"]
-            for group in grouped
-        }
+        lines_per_record = {record.id: count for record, count in grouped}
         button_per_lines = {0: "start", 1: "stop"}
         for record in self:
             record.show_time_control = button_per_lines.get(
@@ -49,130 +49,356 @@ class TimesheetTimeReport(models.Model):
     )
     year = fields.Integer(string="Year", readonly=True)
 
+    # Lean base relation holding only raw columns; the expensive calendar
+    # projections (to_char/EXTRACT) are layered on top by a plain view so
+    # they are computed on demand instead of for every refreshed row.
+    _base_table = "timesheet_time_report_base"
+
+    def _base_query(self):
+        return """
+            SELECT
+                aal.id AS id,
+                aal.date AS date,
+                aal.employee_id AS employee_id,
+                aal.user_id AS user_id,
+                aal.project_id AS project_id,
+                aal.task_id AS task_id,
+                aal.unit_amount AS unit_amount,
+                aal.date_time AS date_time,
+                aal.company_id AS company_id,
+                emp.department_id AS department_id
+            FROM account_analytic_line aal
+            LEFT JOIN hr_employee emp ON emp.id = aal.employee_id
+            WHERE aal.project_id IS NOT NULL
+        """
+
+    def _calendar_query(self):
+        return """
+            SELECT
+                base.*,
+                trim(to_char(base.date, 'Day')) AS day_of_week,
+                EXTRACT(WEEK FROM base.date)::integer AS week_number,
+                to_char(base.date, 'MM') AS month,
+                EXTRACT(QUARTER FROM base.date)::text AS quarter,
+                EXTRACT(YEAR FROM base.date)::integer AS year
+            FROM %s base
+        """ % self._base_table
+
+    # Daily rollup fed by the same source rows; dashboard totals only need
+    # per-day granularity, so they scan this much smaller relation.
+    _rollup_table = "timesheet_time_report_daily"
+
+    def _rollup_query(self):
+        return """
+            SELECT
+                aal.user_id AS user_id,
+                aal.employee_id AS employee_id,
+                emp.department_id AS department_id,
+                aal.project_id AS project_id,
+                aal.task_id AS task_id,
+                aal.company_id AS company_id,
+                aal.date AS date,
+                SUM(aal.unit_amount) AS unit_amount
+            FROM account_analytic_line aal
+            LEFT JOIN hr_employee emp ON emp.id = aal.employee_id
+            WHERE aal.project_id IS NOT NULL
+            GROUP BY
+                aal.user_id,
+                aal.employee_id,
+                emp.department_id,
+                aal.project_id,
+                aal.task_id,
+                aal.company_id,
+                aal.date
+        """
+
+    @api.model
+    def _is_materialized(self):
+        """Whether the report is backed by a materialized view.
+
+        Admins can set ``project_timesheet_time_control.report_materialized``
+        to a falsy value to fall back to a plain (always fresh) view.
+        """
+        return tools.str2bool(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param(
+                "project_timesheet_time_control.report_materialized", "True"
+            ),
+            default=True,
+        )
+
     def init(self):
-        tools.drop_view_if_exists(self.env.cr, self._table)
-        self.env.cr.execute(
-            """
-            CREATE OR REPLACE VIEW %s AS (
-                SELECT
-                    aal.id AS id,
-                    aal.date AS date,
-                    aal.employee_id AS employee_id,
-                    aal.user_id AS user_id,
-                    aal.project_id AS project_id,
-                    aal.task_id AS task_id,
-                    aal.unit_amount AS unit_amount,
-                    aal.date_time AS date_time,
-                    aal.company_id AS company_id,
-                    emp.department_id AS department_id,
-                    trim(to_char(aal.date, 'Day')) AS day_of_week,
-                    EXTRACT(WEEK FROM aal.date)::integer AS week_number,
-                    to_char(aal.date, 'MM') AS month,
-                    EXTRACT(QUARTER FROM aal.date)::text AS quarter,
-                    EXTRACT(YEAR FROM aal.date)::integer AS year
-                FROM account_analytic_line aal
-                LEFT JOIN hr_employee emp ON emp.id = aal.employee_id
-                WHERE aal.project_id IS NOT NULL
+        for table in (self._table, self._base_table, self._rollup_table):
+            # IF EXISTS only tolerates a missing relation, not one of the
+            # other kind (DROP MATERIALIZED VIEW on a plain view raises
+            # 42809), so probe relkind and drop accordingly.
+            self.env.cr.execute(
+                "SELECT relkind FROM pg_class WHERE relname = %s", (table,)
+            )
+            row = self.env.cr.fetchone()
+            if row and row[0] == "m":
+                self.env.cr.execute(
+                    "DROP MATERIALIZED VIEW IF EXISTS %s CASCADE" % table
+                )
+            else:
+                tools.drop_view_if_exists(self.env.cr, table)
+        if self._is_materialized():
+            self.env.cr.execute(
+                "CREATE MATERIALIZED VIEW %s AS (%s)"
+                % (self._base_table, self._base_query())
+            )
+            # Unique id index: cheap keyed lookups, and keeps a concurrent
+            # refresh possible for operators running one out-of-band.
+            self.env.cr.execute(
+                "CREATE UNIQUE INDEX %s_id_idx ON %s (id)"
+                % (self._base_table, self._base_table)
             )
+            self.env.cr.execute(
+                "CREATE INDEX %s_user_date_idx ON %s (user_id, date)"
+                % (self._base_table, self._base_table)
+            )
+            self.env.cr.execute(
+                "CREATE INDEX %s_project_date_idx ON %s (project_id, date)"
+                % (self._base_table, self._base_table)
+            )
+            self.env.cr.execute(
+                "CREATE INDEX %s_date_idx ON %s (date)"
+                % (self._base_table, self._base_table)
+            )
+            self.env.cr.execute(
+                "CREATE VIEW %s AS (%s)" % (self._table, self._calendar_query())
+            )
+            self.env.cr.execute(
+                "CREATE MATERIALIZED VIEW %s AS (%s)"
+                % (self._rollup_table, self._rollup_query())
+            )
+            self.env.cr.execute(
+                "CREATE INDEX %s_user_date_idx ON %s (user_id, date)"
+                % (self._rollup_table, self._rollup_table)
+            )
+            self.env.cr.execute(
+                "CREATE INDEX %s_project_date_idx ON %s (project_id, date)"
+                % (self._rollup_table, self._rollup_table)
+            )
+        else:
+            self.env.cr.execute(
+                "CREATE VIEW %s AS (%s)"
+                % (self._base_table, self._base_query())
+            )
+            self.env.cr.execute(
+                "CREATE VIEW %s AS (%s)" % (self._table, self._calendar_query())
+            )
+            self.env.cr.execute(
+                "CREATE VIEW %s AS (%s)"
+                % (self._rollup_table, self._rollup_query())
+            )
+
+    @api.model
+    def _refresh(self):
+        """Refresh the materialized views.
+
+        Called by the ``ir_cron_refresh_timesheet_time_report`` cron.  The
+        refreshes are deliberately non-concurrent: ``REFRESH MATERIALIZED
+        VIEW CONCURRENTLY`` cannot run inside a transaction block, and cron
+        jobs always execute in one.
         """
-            % self._table
+        if not self._is_materialized():
+            return
+        self.env.cr.execute(
+            "REFRESH MATERIALIZED VIEW %s" % self._base_table
+        )
+        self.env.cr.execute(
+            "REFRESH MATERIALIZED VIEW %s" % self._rollup_table
         )
 
     @api.model
     def get_dashboard_data(self):
-        """Return aggregated data for the timesheet dashboard."""
-        user = self.env.user
-        today = fields.Date.context_today(self)
+        """Return aggregated data for the timesheet dashboard.
+
+        The payload only changes when the day rolls over or when timesheet
+        lines are touched, so it is memoized per (user, day); analytic line
+        create/write/unlink invalidate the cache.
+        """
+        return self._get_dashboard_data_cached(
+            self.env.uid,
+            fields.Date.to_string(fields.Date.context_today(self)),
+        )
+
+    @api.model
+    @tools.ormcache("uid", "today")
+    def _get_dashboard_data_cached(self, uid, today):
+        """Compute the dashboard payload for ``uid`` on ``today`` (ISO date).
+
+        All figures come from two SQL statements: one aggregate pass with
+        ``FILTER`` clauses for the five period totals, and one ``GROUPING
+        SETS`` pass computing the project and daily breakdowns together.
+        """
+        user = self.env["res.users"].browse(uid)
+        today = fields.Date.from_string(today)
         week_start = today - timedelta(days=today.weekday())
         month_start = today.replace(day=1)
-
-        base_domain = [("project_id", "!=", False)]
-        if not user.has_group("hr_timesheet.group_timesheet_manager"):
-            base_domain.append(("user_id", "=", user.id))
-
-        # Today total
-        today_domain = base_domain + [("date", "=", today)]
-        today_data = self.read_group(today_domain, ["unit_amount"], [])
-        today_total = today_data[0]["unit_amount"] if today_data else 0
-
-        # Week total
-        week_domain = base_domain + [
-            ("date", ">=", week_start),
-            ("date", "<=", today),
-        ]
-        week_data = self.read_group(week_domain, ["unit_amount"], [])
-        week_total = week_data[0]["unit_amount"] if week_data else 0
-
-        # Month total
-        month_domain = base_domain + [
-            ("date", ">=", month_start),
-            ("date", "<=", today),
-        ]
-        month_data = self.read_group(month_domain, ["unit_amount"], [])
-        month_total = month_data[0]["unit_amount"] if month_data else 0
-
-        # Quarter
         quarter_month = ((today.month - 1) // 3) * 3 + 1
         quarter_start = today.replace(month=quarter_month, day=1)
-        quarter_domain = base_domain + [
-            ("date", ">=", quarter_start),
-            ("date", "<=", today),
-        ]
-        quarter_data = self.read_group(quarter_domain, ["unit_amount"], [])
-        quarter_total = quarter_data[0]["unit_amount"] if quarter_data else 0
-
-        # Year
         year_start = today.replace(month=1, day=1)
-        year_domain = base_domain + [
-            ("date", ">=", year_start),
-            ("date", "<=", today),
-        ]
-        year_data = self.read_group(year_domain, ["unit_amount"], [])
-        year_total = year_data[0]["unit_amount"] if year_data else 0
-
-        # Project breakdown for this month
-        breakdown_data = self.read_group(
-            month_domain,
-            ["unit_amount", "project_id", "task_id"],
-            ["project_id", "task_id"],
-            lazy=False,
-        )
-        breakdown = []
-        for item in breakdown_data:
-            proj_id = item["project_id"][0] if item["project_id"] else 0
-            task_id = item["task_id"][0] if item["task_id"] else 0
-            breakdown.append(
-                {
-                    "id": f"{proj_id}_{task_id}",
-                    "project_name": (
-                        item["project_id"][1] if item["project_id"] else ""
-                    ),
-                    "task_name": item["task_id"][1] if item["task_id"] else "",
-                    "hours": item["unit_amount"] or 0,
-                    "percentage": (
-                        round((item["unit_amount"] or 0) / month_total * 100, 1)
-                        if month_total
-                        else 0
-                    ),
+
+        user_condition = ""
+        params = {
+            "today": today,
+            "week_start": week_start,
+            "month_start": month_start,
+            "quarter_start": quarter_start,
+            "year_start": year_start,
+            # The current week may start before the year/month (boundary
+            # weeks), hence the explicit range starts.
+            "totals_start": min(year_start, week_start),
+            "breakdown_start": min(month_start, week_start),
+            "user_id": user.id,
+        }
+        if not user.has_group("hr_timesheet.group_timesheet_manager"):
+            user_condition = "AND user_id = %(user_id)s"
+            # Existence probe: users who never logged project time (new
+            # hires, rarely-active users) skip the aggregate passes.
+            self.env.cr.execute(
+                "SELECT 1 FROM account_analytic_line "
+                "WHERE user_id = %(user_id)s AND project_id IS NOT NULL "
+                "LIMIT 1",
+                params,
+            )
+            if not self.env.cr.fetchone():
+                return {
+                    "today_total": 0,
+                    "week_total": 0,
+                    "month_total": 0,
+                    "quarter_total": 0,
+                    "year_total": 0,
+                    "project_breakdown": [],
+                    "daily_breakdown": [],
                 }
+        try:
+            params["min_hours"] = float(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param(
+                    "project_timesheet_time_control.breakdown_min_hours",
+                    "0.25",
+                )
             )
-        breakdown.sort(key=lambda x: x["hours"], reverse=True)
+        except ValueError:
+            params["min_hours"] = 0.25
+
+        # Period totals: the CTE narrows the scan to the filtered rows once,
+        # then the five filtered aggregates run over that single pass.
+        self.env.cr.execute(
+            f"""
+            WITH base AS (
+                SELECT date, unit_amount
+                FROM {self._rollup_table}
+                WHERE date >= %(totals_start)s
+                  AND date <= %(today)s
+                  {user_condition}
+            )
+            SELECT
+                COALESCE(SUM(unit_amount)
+                         FILTER (WHERE date = %(today)s), 0),
+                COALESCE(SUM(unit_amount)
+                         FILTER (WHERE date >= %(week_start)s), 0),
+                COALESCE(SUM(unit_amount)
+                         FILTER (WHERE date >= %(month_start)s), 0),
+                COALESCE(SUM(unit_amount)
+                         FILTER (WHERE date >= %(quarter_start)s), 0),
+                COALESCE(SUM(unit_amount)
+                         FILTER (WHERE date >= %(year_start)s), 0)
+            FROM base
+            """,
+            params,
+        )
+        (
+            today_total,
+            week_total,
+            month_total,
+            quarter_total,
+            year_total,
+        ) = self.env.cr.fetchone()
+
+        # Breakdowns: project/task over the month and per-day over the week
+        # computed in a single pass.  GROUPING() distinguishes the two sets
+        # (bit set when the column is aggregated away): 1 → (project, task),
+        # 6 → (date).
+        self.env.cr.execute(
+            f"""
+            SELECT
+                GROUPING(project_id, task_id, date) AS grouping_mask,
+                project_id,
+                task_id,
+                date,
+                SUM(unit_amount)
+                    FILTER (WHERE date >= %(month_start)s) AS month_hours,
+                SUM(unit_amount)
+                    FILTER (WHERE date >= %(week_start)s) AS week_hours
+            FROM {self._rollup_table}
+            WHERE date >= %(breakdown_start)s
+              AND date <= %(today)s
+              {user_condition}
+            GROUP BY GROUPING SETS ((project_id, task_id), (date))
+            HAVING GROUPING(project_id, task_id, date) <> 1
+                OR SUM(unit_amount)
+                       FILTER (WHERE date >= %(month_start)s) > %(min_hours)s
+            ORDER BY
+                GROUPING(project_id, task_id, date),
+                -- daily rows (mask 6) come back chronologically; only the
+                -- project/task rows are sorted by hours
+                CASE WHEN GROUPING(project_id, task_id, date) = 6
+                     THEN date END,
+                SUM(unit_amount)
+                    FILTER (WHERE date >= %(month_start)s) DESC NULLS LAST
+            """,
+            params,
+        )
+        rows = self.env.cr.fetchall()
 
-        # Daily breakdown for the current week (for chart)
-        daily_data = self.read_group(
-            week_domain,
-            ["unit_amount", "date"],
-            ["date:day"],
-            lazy=False,
+        # Prime display_name for every project/task in one SQL each
+        projects = self.env["project.project"].browse(
+            {row[1] for row in rows if row[0] == 1 and row[1]}
         )
+        tasks = self.env["project.task"].browse(
+            {row[2] for row in rows if row[0] == 1 and row[2]}
+        )
+        project_names = {p.id: p.display_name for p in projects}
+        task_names = {t.id: t.display_name for t in tasks}
+
+        breakdown = []
         daily_breakdown = []
-        for item in daily_data:
-            daily_breakdown.append(
-                {
-                    "date": item["date:day"],
-                    "hours": item["unit_amount"] or 0,
-                }
-            )
+        for row in rows:
+            mask, project_id, task_id, date, month_hours, week_hours = row
+            if mask == 1:
+                breakdown.append(
+                    {
+                        "id": f"{project_id or 0}_{task_id or 0}",
+                        "project_name": project_names.get(project_id, ""),
+                        "task_name": task_names.get(task_id, ""),
+                        "hours": month_hours or 0,
+                        # Share of the full month total from the first
+                        # query, not of the rows surviving the min-hours
+                        # filter.
+                        "percentage": (
+                            round(100.0 * (month_hours or 0) / month_total, 1)
+                            if month_total
+                            else 0.0
+                        ),
+                    }
+                )
+            elif week_hours:
+                daily_breakdown.append(
+                    {
+                        # Same label read_group produced for day groups;
+                        # the chart displays it verbatim.
+                        "date": tools.format_date(
+                            self.env, date, date_format="dd MMM yyyy"
+                        ),
+                        "hours": week_hours,
+                    }
+                )
 
         return {
             "today_total": today_total or 0,
@@ -3,6 +3,8 @@
 from odoo import http, _
 from odoo.http import request
 
+from .knowledge_api import partner_avatar_urls
+
 
 class ArticleThreadController(http.Controller):
     """Controller for knowledge article comment threads."""
@@ -28,30 +30,66 @@ class ArticleThreadController(http.Controller):
     @http.route('/knowledge/thread/resolve', type='json', auth='user')
     def resolve_thread(self, thread_id):
         """Toggle resolved state on a thread."""
-        thread = request.env['knowledge.article.thread'].browse(thread_id)
-        if not thread.exists():
+        thread = request.env['knowledge.article.thread'].browse(thread_id).exists()
+        if not thread:
             return {'error': 'Thread not found'}
-        thread.write({'is_resolved': not thread.is_resolved})
-        return {'thread_id': thread_id, 'is_resolved': thread.is_resolved}
+        # ORM write on purpose: it enforces the thread write record rule
+        # and posts the is_resolved tracking message.
+        thread.is_resolved = not thread.is_resolved
+        return {'thread_id': thread.id, 'is_resolved': thread.is_resolved}
 
     @http.route('/knowledge/threads/messages', type='json', auth='user', methods=['POST'])
     def get_threads_messages(self, thread_ids, limit=30):
         """Fetch messages for multiple threads at once."""
-        threads = request.env['knowledge.article.thread'].browse(thread_ids)
-        result = {}
-        for thread in threads.exists():
-            messages = thread.message_ids[:limit]
-            result[thread.id] = {
+        threads = request.env['knowledge.article.thread'].browse(thread_ids).exists()
+        if not threads:
+            return {}
+
+        # One SELECT for all threads' messages instead of one per thread,
+        # with a per-thread window: ROW_NUMBER caps every thread at
+        # `limit` messages, so one busy thread cannot starve the others.
+        request.env['mail.message'].flush_model(
+            ['model', 'res_id', 'body', 'author_id', 'date'],
+        )
+        request.env.cr.execute(
+            """
+            SELECT id, body, author_id, date, res_id
+              FROM (
+                SELECT id, body, author_id, date, res_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY res_id ORDER BY id DESC
+                       ) AS rn
+                  FROM mail_message
+                 WHERE model = 'knowledge.article.thread'
+                   AND res_id = ANY(%s)
+              ) windowed
+             WHERE rn <= %s
+             ORDER BY id DESC
+            """,
+            [threads.ids, limit],
+        )
+        rows = request.env.cr.fetchall()
+        author_ids = {author_id for __, __, author_id, __, __ in rows if author_id}
+        authors = request.env['res.partner'].browse(author_ids)
+        author_names = {partner.id: partner.display_name for partner in authors}
+        avatars = partner_avatar_urls(request.env, author_ids)
+        messages_by_thread = {}
+        for msg_id, body, author_id, date, res_id in rows:
+            messages_by_thread.setdefault(res_id, []).append({
+                'id': msg_id,
+                'body': body,
+                'author_id': author_id or False,
+                'author_name': author_names.get(author_id, ''),
+                'author_avatar': avatars.get(author_id, ''),
+                'date': date.isoformat() if date else '',
+            })
+
+        return {
+            thread.id: {
                 'thread_id': thread.id,
                 'anchor_text': thread.article_anchor_text,
                 'is_resolved': thread.is_resolved,
-                'messages': [{
-                    'id': msg.id,
-                    'body': msg.body,
-                    'author_id': msg.author_id.id,
-                    'author_name': msg.author_id.display_name,
-                    'author_avatar': f'/web/image/res.partner/{msg.author_id.id}/avatar_128',
-                    'date': msg.date.isoformat() if msg.date else '',
-                } for msg in messages],
+                'messages': messages_by_thread.get(thread.id, []),
             }
-        return result
+            for thread in threads
+        }
@@ -1,43 +1,87 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
 import json
 
+import werkzeug
+
 from odoo import http, _
 from odoo.http import request
 
 
+def partner_avatar_urls(env, partner_ids):
+    """Return ``{partner_id: avatar URL}`` for the given partners.
+
+    The URL embeds the partner's write_date so browsers can cache the
+    image aggressively while still picking up avatar changes.
+    """
+    if not partner_ids:
+        return {}
+    env.cr.execute(
+        "SELECT id, write_date FROM res_partner WHERE id = ANY(%s)",
+        [list(partner_ids)],
+    )
+    template = '/web/image/res.partner/{pid}/avatar_128?unique={unique}'.format
+    return {
+        pid: template(pid=pid, unique=int(write_date.timestamp()))
+        for pid, write_date in env.cr.fetchall()
+    }
+
+
 class KnowledgeAPIController(http.Controller):
     """API endpoints for knowledge articles (public sharing, stats)."""
 
     @http.route('/knowledge/article/<string:token>', type='http', auth='public', website=False)
     def article_public_view(self, token):
         """Public article view via share token."""
-        article = request.env['knowledge.article'].sudo().search([
-            ('share_token', '=', token),
-            ('is_published', '=', True),
-        ], limit=1)
-        if not article:
+        # Cheap pre-check so 304 responses skip ORM materialization and the
+        # template render entirely.
+        request.env.cr.execute(
+            "SELECT id, write_date FROM knowledge_article "
+            "WHERE share_token = %s AND is_published = TRUE "
+            "AND active = TRUE LIMIT 1",
+            (token,),
+        )
+        row = request.env.cr.fetchone()
+        if not row:
             return request.not_found()
-        
-        return request.render('syntropy_knowledge.article_public_template', {
+        article_id, write_date = row
+
+        etag = hashlib.blake2s(
+            f'{article_id}-{write_date.timestamp()}'.encode()
+        ).hexdigest()
+        if request.httprequest.headers.get('If-None-Match') == etag:
+            return werkzeug.wrappers.Response(status=304)
+
+        article = request.env['knowledge.article'].sudo().browse(article_id)
+        response = request.render('syntropy_knowledge.article_public_template', {
             'article': article,
         })
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        return response
 
     @http.route('/knowledge/article/increment_view', type='json', auth='user')
     def increment_view(self, article_id):
         """Increment view count and create view log."""
-        article = request.env['knowledge.article'].browse(article_id)
-        if not article.exists():
+        # Atomic increment: no read-modify-write race, no ORM write cascade.
+        # A missing article simply updates zero rows.
+        request.env.cr.execute(
+            "UPDATE knowledge_article SET views_count = views_count + 1 "
+            "WHERE id = %s RETURNING views_count",
+            (article_id,),
+        )
+        row = request.env.cr.fetchone()
+        if not row:
             return {'error': 'Article not found'}
-        
-        article.sudo().write({
-            'views_count': article.views_count + 1,
-        })
-        request.env['knowledge.article.view.log'].sudo().create({
-            'article_id': article_id,
-            'user_id': request.env.uid,
-        })
-        return {'views_count': article.views_count}
+
+        request.env['knowledge.article'].browse(article_id).invalidate_recordset(
+            ['views_count']
+        )
+        request.env['knowledge.article.view.log.hourly'].sudo()._bump(
+            article_id, request.env.uid,
+        )
+        return {'views_count': row[0]}
 
     @http.route('/knowledge/article/toggle_like', type='json', auth='user')
     def toggle_like(self, article_id):
@@ -46,10 +90,24 @@ class KnowledgeAPIController(http.Controller):
         if not article.exists():
             return {'error': 'Article not found'}
         
-        result = article.action_toggle_like()
+        article.action_toggle_like()
+
+        # Probe the relation table instead of materializing the whole
+        # liked_by_ids set just to test membership.
+        article.env.flush_all()
+        request.env.cr.execute(
+            "SELECT 1 FROM knowledge_article_likes_rel "
+            "WHERE article_id = %s AND partner_id = %s LIMIT 1",
+            (article.id, request.env.user.partner_id.id),
+        )
+        is_liked = bool(request.env.cr.fetchone())
+        request.env.cr.execute(
+            "SELECT likes_count FROM knowledge_article WHERE id = %s",
+            (article.id,),
+        )
         return {
-            'likes_count': article.likes_count,
-            'is_liked': request.env.user.partner_id in article.liked_by_ids,
+            'likes_count': request.env.cr.fetchone()[0],
+            'is_liked': is_liked,
         }
 
     @http.route('/knowledge/article/<int:article_id>/messages', type='json', auth='user')
@@ -59,15 +117,32 @@ class KnowledgeAPIController(http.Controller):
         if not article.exists():
             return {'error': 'Article not found'}
         
-        messages = article.message_ids[offset:offset + limit]
+        # Page in SQL: only the requested window is fetched, instead of
+        # loading the whole thread and slicing in Python.
+        messages = request.env['mail.message'].search_read(
+            [
+                ('model', '=', 'knowledge.article'),
+                ('res_id', '=', article.id),
+            ],
+            ['body', 'author_id', 'date', 'message_type'],
+            limit=limit,
+            offset=offset,
+            order='id desc',
+        )
+        avatars = partner_avatar_urls(
+            request.env,
+            {msg['author_id'][0] for msg in messages if msg['author_id']},
+        )
         return [{
-            'id': msg.id,
-            'body': msg.body,
-            'author_id': msg.author_id.id,
-            'author_name': msg.author_id.display_name,
-            'author_avatar': f'/web/image/res.partner/{msg.author_id.id}/avatar_128',
-            'date': msg.date.isoformat() if msg.date else '',
-            'message_type': msg.message_type,
+            'id': msg['id'],
+            'body': msg['body'],
+            'author_id': msg['author_id'][0] if msg['author_id'] else False,
+            'author_name': msg['author_id'][1] if msg['author_id'] else '',
+            'author_avatar': (
+                avatars.get(msg['author_id'][0], '') if msg['author_id'] else ''
+            ),
+            'date': msg['date'].isoformat() if msg['date'] else '',
+            'message_type': msg['message_type'],
         } for msg in messages]
 
     @http.route('/knowledge/article/search', type='json', auth='user')
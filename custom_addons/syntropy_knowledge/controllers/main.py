@@ -31,42 +31,23 @@ class KnowledgeController(http.Controller):
         if not article.exists():
             return {'error': 'Article not found'}
         
-        members_data = []
-        for member in article.article_member_ids:
-            members_data.append({
-                'id': member.id,
-                'partner_id': member.partner_id.id,
-                'partner_name': member.partner_id.display_name,
-                'partner_email': member.partner_id.email,
-                'partner_avatar': f'/web/image/res.partner/{member.partner_id.id}/avatar_128',
-                'permission': member.permission,
-                'is_current_user': member.partner_id == request.env.user.partner_id,
-            })
-        
-        # Department-based access
-        view_departments = [{'id': d.id, 'name': d.name} for d in article.view_department_ids]
-        edit_departments = [{'id': d.id, 'name': d.name} for d in article.edit_department_ids]
-        view_users = [{'id': u.id, 'name': u.name} for u in article.view_user_ids]
-        edit_users = [{'id': u.id, 'name': u.name} for u in article.edit_user_ids]
-
-        return {
-            'article_id': article.id,
-            'name': article.display_name,
-            'internal_permission': article.internal_permission,
-            'inherited_permission': article.inherited_permission,
+        # The user-independent payload is precomputed in a stored Json
+        # column; only layer the user-specific keys on top.
+        article_sudo = article.sudo()
+        data = dict(
+            article_sudo.permission_panel_cache
+            or article_sudo._build_permission_panel_data()
+        )
+        current_partner_id = request.env.user.partner_id.id
+        data['members'] = [
+            dict(member, is_current_user=member['partner_id'] == current_partner_id)
+            for member in data.get('members', [])
+        ]
+        data.update({
             'category': article.category,
-            'is_desynchronized': article.is_desynchronized,
             'user_permission': article.user_permission,
-            'parent_id': article.parent_id.id if article.parent_id else False,
-            'parent_name': article.parent_id.display_name if article.parent_id else False,
-            'members': members_data,
-            'view_departments': view_departments,
-            'edit_departments': edit_departments,
-            'view_users': view_users,
-            'edit_users': edit_users,
-            'share_token': article.share_token,
-            'is_published': article.is_published,
-        }
+        })
+        return data
 
     @http.route('/knowledge/article/set_member_permission', type='json', auth='user')
     def set_member_permission(self, article_id, member_id, permission):
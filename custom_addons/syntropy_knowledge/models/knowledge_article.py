@@ -8,13 +8,18 @@ from datetime import datetime, timedelta
 from markupsafe import Markup
 from bs4 import BeautifulSoup
 
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import AccessError, ValidationError
-from odoo.osv import expression
 from odoo.tools import is_html_empty
 from odoo.tools.sql import create_index, make_index_name, SQL
 
 ARTICLE_PERMISSION_LEVEL = {'none': 0, 'read': 1, 'write': 2}
+# Hot-path variant: falsy keys map to 0 so callers can index directly
+# instead of paying for .get() with a default on every compare.
+_PERM_LEVEL = {**ARTICLE_PERMISSION_LEVEL, None: 0, False: 0}
+
+# Escapes ILIKE wildcards; compiled once at import instead of per search.
+_ILIKE_ESCAPE_RE = re.compile(r'(%|_|\\)')
 
 
 class KnowledgeArticle(models.Model):
@@ -50,6 +55,15 @@ class KnowledgeArticle(models.Model):
         sanitize=False,
         prefetch=False,
     )
+    body_text = fields.Text(
+        string="Body Text",
+        compute='_compute_body_text',
+        store=True,
+        prefetch=False,
+        index='trigram',
+        help="Plain-text mirror of the body, maintained on write and used "
+             "for search and snippet extraction.",
+    )
     icon = fields.Char(
         string="Icon",
         size=30,
@@ -98,6 +112,7 @@ class KnowledgeArticle(models.Model):
         tracking=30,
         index=True,
         ondelete='cascade',
+        auto_join=True,
     )
     parent_path = fields.Char(index=True)
     child_ids = fields.One2many(
@@ -115,6 +130,7 @@ class KnowledgeArticle(models.Model):
         compute_sudo=True,
         tracking=10,
         index=True,
+        auto_join=True,
     )
     has_article_children = fields.Boolean(
         string="Has Children",
@@ -243,6 +259,13 @@ class KnowledgeArticle(models.Model):
         string="User Permission",
         compute='_compute_user_permission',
     )
+    permission_panel_cache = fields.Json(
+        string="Permission Panel Cache",
+        compute='_compute_permission_panel_cache',
+        compute_sudo=True,
+        store=True,
+        help="Precomputed user-independent payload of the permission panel.",
+    )
 
     # ------------------------------------------------------------------
     # Fields — Category & tags
@@ -403,6 +426,39 @@ class KnowledgeArticle(models.Model):
             [SQL("name gin_trgm_ops")],
             method='GIN',
         )
+        # Public-view hot path: token lookup and published filter
+        self.env.cr.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS "
+            "knowledge_article_share_token_unique_idx "
+            "ON knowledge_article (share_token) "
+            "WHERE share_token IS NOT NULL"
+        )
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_published_idx "
+            "ON knowledge_article (is_published) "
+            "WHERE is_published IS TRUE"
+        )
+        # Sidebar "has children" probe
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_parent_notitem_idx "
+            "ON knowledge_article (parent_id) "
+            "WHERE is_article_item IS NOT TRUE"
+        )
+        # Descendant lookups (child_of lowers to parent_path =like for
+        # parent_store models): the default btree cannot serve LIKE prefix
+        # scans under non-C collations, text_pattern_ops can.
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_parent_path_like_idx "
+            "ON knowledge_article (parent_path text_pattern_ops)"
+        )
+        # Accessible-article lookup: inherited-permission scan (the member
+        # grant probe index lives in KnowledgeArticleMember.init(), whose
+        # table is not guaranteed to exist yet when this model initializes)
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_inherited_perm_idx "
+            "ON knowledge_article (inherited_permission) "
+            "WHERE inherited_permission IN ('read', 'write')"
+        )
 
     # ==================================================================
     # CONSTRAINTS
@@ -419,6 +475,10 @@ class KnowledgeArticle(models.Model):
     @api.constrains('internal_permission', 'article_member_ids')
     def _check_is_writable(self):
         """Articles must always have at least one writer."""
+        # Load every member's permission in one query up front; constraints
+        # often run with a prefetch set of a single record, which would
+        # otherwise make _has_write_member query once per article.
+        self.article_member_ids.fetch(['permission'])
         for article in self:
             if article.inherited_permission != 'write' and not article._has_write_member():
                 raise ValidationError(
@@ -447,21 +507,42 @@ class KnowledgeArticle(models.Model):
         if not with_parent:
             return
 
-        articles_by_parent = defaultdict(lambda: self.env['knowledge.article'])
+        articles_by_parent = defaultdict(list)
         for article in with_parent:
-            articles_by_parent[article.parent_id] += article
-
-        for parent, articles in articles_by_parent.items():
-            ancestors = self.env['knowledge.article']
-            while parent:
-                if parent in ancestors:
-                    raise ValidationError(
-                        _("Articles %s cannot be updated as this would create a recursive hierarchy.",
-                          ', '.join(articles.mapped('name')))
-                    )
-                ancestors += parent
-                parent = parent.parent_id
-            articles.root_article_id = ancestors[-1:]
+            articles_by_parent[article.parent_id.id].append(article.id)
+
+        # One recursive CTE resolves every parent chain in a single round
+        # trip (vs. one query per hop per chain); the path array doubles as
+        # the cycle detector.
+        self.env['knowledge.article'].flush_model(['parent_id'])
+        self.env.cr.execute(SQL("""
+            WITH RECURSIVE chain(start_id, id, parent_id, path, cycle) AS (
+                SELECT ka.id, ka.id, ka.parent_id, ARRAY[ka.id], FALSE
+                  FROM knowledge_article ka
+                 WHERE ka.id IN %(parent_ids)s
+                UNION ALL
+                SELECT c.start_id, ka.id, ka.parent_id,
+                       c.path || ka.id, ka.id = ANY(c.path)
+                  FROM knowledge_article ka
+                  JOIN chain c ON ka.id = c.parent_id
+                 WHERE NOT c.cycle
+            )
+            SELECT start_id, id, cycle
+              FROM chain
+             WHERE parent_id IS NULL OR cycle
+        """, parent_ids=tuple(articles_by_parent)))
+
+        root_by_parent = {}
+        for parent_id, root_id, cycle in self.env.cr.fetchall():
+            if cycle:
+                raise ValidationError(
+                    _("Articles %s cannot be updated as this would create a recursive hierarchy.",
+                      ', '.join(self.browse(articles_by_parent[parent_id]).mapped('name')))
+                )
+            root_by_parent[parent_id] = root_id
+
+        for parent_id, article_ids in articles_by_parent.items():
+            self.browse(article_ids).root_article_id = root_by_parent.get(parent_id)
 
     # ---- Inherited permission ----------------------------------------
 
@@ -480,24 +561,61 @@ class KnowledgeArticle(models.Model):
         if not remaining:
             return
 
-        articles_by_parent = defaultdict(lambda: self.env['knowledge.article'])
+        articles_by_parent = defaultdict(list)
         for article in remaining:
-            articles_by_parent[article.parent_id] += article
-
-        for parent, articles in articles_by_parent.items():
-            ancestors = self.env['knowledge.article']
-            while parent:
-                if parent in ancestors:
-                    raise ValidationError(
-                        _("Articles %s cannot be updated as this would create a recursive hierarchy.",
-                          ', '.join(articles.mapped('name')))
-                    )
-                ancestors += parent
-                if parent.internal_permission or parent.is_desynchronized:
-                    break
-                parent = parent.parent_id
-            articles.inherited_permission = ancestors[-1:].internal_permission
-            articles.inherited_permission_parent_id = ancestors[-1:]
+            articles_by_parent[article.parent_id].append(article.id)
+
+        # parent_path already materialises every ancestor chain, so one
+        # keyed SELECT fetches the permission data for all ancestors of all
+        # parents — no per-hop parent_id walk.
+        chains = {}
+        all_ancestor_ids = set()
+        for parent in articles_by_parent:
+            if parent.parent_path:
+                chain = [int(p) for p in parent.parent_path.strip('/').split('/') if p]
+                chain.reverse()  # nearest ancestor first
+                chains[parent] = chain
+                all_ancestor_ids.update(chain)
+
+        ancestor_info = {}
+        if all_ancestor_ids:
+            self.flush_model(['internal_permission', 'is_desynchronized'])
+            self.env.cr.execute(SQL("""
+                SELECT id, internal_permission, is_desynchronized
+                  FROM knowledge_article
+                 WHERE id IN %(ids)s
+            """, ids=tuple(all_ancestor_ids)))
+            ancestor_info = {
+                row[0]: (row[1], row[2]) for row in self.env.cr.fetchall()
+            }
+
+        for parent, article_ids in articles_by_parent.items():
+            articles = self.browse(article_ids)
+            chain = chains.get(parent)
+            if chain:
+                source_id = next(
+                    (
+                        ancestor_id for ancestor_id in chain
+                        if ancestor_info.get(ancestor_id, (None, False))[0]
+                        or ancestor_info.get(ancestor_id, (None, False))[1]
+                    ),
+                    chain[-1],
+                )
+                articles.inherited_permission = ancestor_info.get(
+                    source_id, (False, False)
+                )[0]
+                articles.inherited_permission_parent_id = source_id
+            else:
+                # Unsaved parent chain (no parent_path yet): resolve through
+                # the cache.
+                node, ancestor = parent, parent
+                while node:
+                    ancestor = node
+                    if node.internal_permission or node.is_desynchronized:
+                        break
+                    node = node.parent_id
+                articles.inherited_permission = ancestor.internal_permission
+                articles.inherited_permission_parent_id = ancestor
 
     # ---- User permission (hybrid) ------------------------------------
 
@@ -537,46 +655,88 @@ class KnowledgeArticle(models.Model):
         member_permissions = to_update._get_partner_member_permissions(partner)
 
         # ---- department-based ----------------------------------------
-        employee = self.env['hr.employee'].sudo().search(
-            [('user_id', '=', user.id)], limit=1,
-        )
-        department = employee.department_id if employee else self.env['hr.department']
+        department_id = self._get_user_department_id()
+
+        # ---- grant sets ----------------------------------------------
+        # One keyed SELECT per relation table, restricted to the current
+        # user/department, instead of materialising four M2M fields and
+        # linearly scanning their recordsets per article.
+        self.flush_model([
+            'view_department_ids', 'edit_department_ids',
+            'view_user_ids', 'edit_user_ids',
+        ])
 
+        def _granted_article_ids(table, column, value):
+            if not value:
+                return set()
+            self.env.cr.execute(SQL(
+                """
+                SELECT article_id FROM %(table)s
+                 WHERE %(column)s = %(value)s
+                   AND article_id IN %(article_ids)s
+                """,
+                table=SQL.identifier(table),
+                column=SQL.identifier(column),
+                value=value,
+                article_ids=tuple(to_update.ids),
+            ))
+            return {r[0] for r in self.env.cr.fetchall()}
+
+        edit_dept_ids = _granted_article_ids(
+            'knowledge_article_edit_dept_rel', 'department_id', department_id)
+        view_dept_ids = _granted_article_ids(
+            'knowledge_article_view_dept_rel', 'department_id', department_id)
+        edit_user_ids = _granted_article_ids(
+            'knowledge_article_edit_user_rel', 'user_id', user.id)
+        view_user_ids = _granted_article_ids(
+            'knowledge_article_view_user_rel', 'user_id', user.id)
+
+        # Track the highest level as an int and stop as soon as 'write' (2)
+        # is reached — no repeated _highest_permission calls per article.
+        internal_user = not user.share
         for article in to_update:
             article_id = article.ids[0]
-            highest = 'none'
 
             # 1. Partner-based membership
-            member_perm = member_permissions.get(article_id)
-            if member_perm:
-                highest = self._highest_permission(highest, member_perm)
-
-            # 2. Department-based
-            if department:
-                if department in article.edit_department_ids:
-                    highest = self._highest_permission(highest, 'write')
-                elif department in article.view_department_ids:
-                    highest = self._highest_permission(highest, 'read')
-
-            # 3. User-specific
-            if user in article.edit_user_ids:
-                highest = self._highest_permission(highest, 'write')
-            elif user in article.view_user_ids:
-                highest = self._highest_permission(highest, 'read')
+            level = _PERM_LEVEL[member_permissions.get(article_id)]
+
+            # 2/3. Department-based and user-specific grants
+            if level < 2:
+                if article_id in edit_dept_ids or article_id in edit_user_ids:
+                    level = 2
+                elif level < 1 and (
+                    article_id in view_dept_ids or article_id in view_user_ids
+                ):
+                    level = 1
 
             # 4. Inherited (internal) permission
-            inherited = article.inherited_permission or 'none'
-            if not user.share:
-                highest = self._highest_permission(highest, inherited)
+            if level < 2 and internal_user:
+                inherited_level = _PERM_LEVEL[article.inherited_permission]
+                if inherited_level > level:
+                    level = inherited_level
 
-            article.user_permission = highest
+            article.user_permission = ('none', 'read', 'write')[level]
+
+    def _get_user_department_id(self):
+        """Return the current user's department id, memoised per transaction.
+
+        The employee lookup is identical for every compute/search touching
+        permissions within a request; ``cr.cache`` keeps it to one query
+        per transaction.
+        """
+        cache = self.env.cr.cache.setdefault('knowledge_user_department_id', {})
+        uid = self.env.uid
+        if uid not in cache:
+            employee = self.env['hr.employee'].sudo().search(
+                [('user_id', '=', uid)], limit=1,
+            )
+            cache[uid] = employee.department_id.id if employee else False
+        return cache[uid]
 
     @staticmethod
     def _highest_permission(perm_a, perm_b):
         """Return the higher of two permission strings."""
-        if ARTICLE_PERMISSION_LEVEL.get(perm_a, 0) >= ARTICLE_PERMISSION_LEVEL.get(perm_b, 0):
-            return perm_a
-        return perm_b
+        return perm_a if _PERM_LEVEL[perm_a] >= _PERM_LEVEL[perm_b] else perm_b
 
     # ---- User access booleans ----------------------------------------
 
@@ -604,9 +764,8 @@ class KnowledgeArticle(models.Model):
             raise NotImplementedError("Unsupported search operator")
 
         is_positive = (value and operator == '=') or (not value and operator == '!=')
-        accessible_ids = self._get_accessible_article_ids(permission_level='read')
         op = 'in' if is_positive else 'not in'
-        return [('id', op, list(accessible_ids))]
+        return [('id', op, self._accessible_article_ids_sql(permission_level='read'))]
 
     def _search_user_has_write_access(self, operator, value):
         """Return a domain filtering articles writable by the current user."""
@@ -614,15 +773,16 @@ class KnowledgeArticle(models.Model):
             raise NotImplementedError("Unsupported search operator")
 
         is_positive = (value and operator == '=') or (not value and operator == '!=')
-        writable_ids = self._get_accessible_article_ids(permission_level='write')
         op = 'in' if is_positive else 'not in'
-        return [('id', op, list(writable_ids))]
+        return [('id', op, self._accessible_article_ids_sql(permission_level='write'))]
 
-    def _get_accessible_article_ids(self, permission_level='read'):
-        """Return a set of article IDs accessible to the current user at the
-        given *permission_level* ('read' or 'write').
+    def _accessible_article_ids_sql(self, permission_level='read'):
+        """Return a ``SQL`` subselect of article IDs accessible to the
+        current user at the given *permission_level* ('read' or 'write').
 
-        Uses raw SQL for performance.  Combines:
+        Usable directly as the value of an ``('id', 'in', ...)`` leaf, so
+        searches on ``user_has_access`` become a semi-join instead of a
+        materialised ID list.  Combines:
         1. Partner-based member permissions
         2. Department-based permissions
         3. User-specific permissions (M2M)
@@ -633,93 +793,84 @@ class KnowledgeArticle(models.Model):
 
         if permission_level == 'write':
             required_perms = ('write',)
-            inherited_filter = "= 'write'"
         else:
             required_perms = ('read', 'write')
-            inherited_filter = "IN ('read', 'write')"
 
-        # 1. Member-based
-        self.env.cr.execute(SQL("""
-            SELECT DISTINCT kam.article_id
-              FROM knowledge_article_member kam
-             WHERE kam.partner_id = %(partner_id)s
-               AND kam.permission IN %(perms)s
-        """, partner_id=partner_id, perms=tuple(required_perms)))
-        article_ids = {r[0] for r in self.env.cr.fetchall()}
-
-        # Members with 'none' — exclude from inherited
-        self.env.cr.execute(SQL("""
-            SELECT DISTINCT kam.article_id
-              FROM knowledge_article_member kam
-             WHERE kam.partner_id = %(partner_id)s
-               AND kam.permission = 'none'
-        """, partner_id=partner_id))
-        excluded_ids = {r[0] for r in self.env.cr.fetchall()}
-
-        # 2. Department-based
-        self.env.cr.execute(SQL("""
-            SELECT he.department_id
-              FROM hr_employee he
-             WHERE he.user_id = %(user_id)s
-             LIMIT 1
-        """, user_id=user.id))
-        dept_row = self.env.cr.fetchone()
-        dept_id = dept_row[0] if dept_row else None
-
-        if dept_id:
-            if permission_level == 'write':
-                self.env.cr.execute(SQL("""
-                    SELECT article_id
-                      FROM knowledge_article_edit_dept_rel
-                     WHERE department_id = %(dept_id)s
-                """, dept_id=dept_id))
-            else:
-                self.env.cr.execute(SQL("""
-                    SELECT article_id FROM knowledge_article_edit_dept_rel
-                     WHERE department_id = %(dept_id)s
-                    UNION
-                    SELECT article_id FROM knowledge_article_view_dept_rel
-                     WHERE department_id = %(dept_id)s
-                """, dept_id=dept_id))
-            article_ids |= {r[0] for r in self.env.cr.fetchall()}
-
-        # 3. User-specific M2M
-        if permission_level == 'write':
-            self.env.cr.execute(SQL("""
-                SELECT article_id
-                  FROM knowledge_article_edit_user_rel
+        # Single round trip: all grant sources are UNIONed together and the
+        # 'none' member exclusion (which only applies to the inherited
+        # source) is handled with EXCEPT, all inside one statement.
+        view_dept_source = SQL("""
+                UNION ALL
+                SELECT article_id FROM knowledge_article_view_dept_rel
+                 WHERE department_id = (SELECT he.department_id
+                                          FROM hr_employee he
+                                         WHERE he.user_id = %(user_id)s
+                                         LIMIT 1)
+        """, user_id=user.id) if permission_level != 'write' else SQL()
+        view_user_source = SQL("""
+                UNION ALL
+                SELECT article_id FROM knowledge_article_view_user_rel
                  WHERE user_id = %(user_id)s
-            """, user_id=user.id))
-        else:
-            self.env.cr.execute(SQL("""
+        """, user_id=user.id) if permission_level != 'write' else SQL()
+        # UNION ALL on purpose: consumers either build a Python set (which
+        # dedupes for free) or use the result as an IN subselect (where
+        # duplicates are harmless), so no Sort/HashAggregate node is needed.
+        inherited_source = SQL("""
+            UNION ALL
+            SELECT article_id FROM inherited
+        """) if not user.share else SQL()
+
+        return SQL("""
+            (WITH direct_grants AS (
+                SELECT kam.article_id
+                  FROM knowledge_article_member kam
+                 WHERE kam.partner_id = %(partner_id)s
+                   AND kam.permission IN %(perms)s
+                UNION ALL
+                SELECT article_id FROM knowledge_article_edit_dept_rel
+                 WHERE department_id = (SELECT he.department_id
+                                          FROM hr_employee he
+                                         WHERE he.user_id = %(user_id)s
+                                         LIMIT 1)
+                %(view_dept_source)s
+                UNION ALL
                 SELECT article_id FROM knowledge_article_edit_user_rel
                  WHERE user_id = %(user_id)s
-                UNION
-                SELECT article_id FROM knowledge_article_view_user_rel
-                 WHERE user_id = %(user_id)s
-            """, user_id=user.id))
-        article_ids |= {r[0] for r in self.env.cr.fetchall()}
-
-        # 4. Inherited (internal) permission — only for internal users
-        if not user.share:
-            self.env.cr.execute(SQL("""
-                SELECT id FROM knowledge_article
-                 WHERE inherited_permission %s
-            """ % inherited_filter))
-            inherited_ids = {r[0] for r in self.env.cr.fetchall()}
-            article_ids |= (inherited_ids - excluded_ids)
-
-        return article_ids
+                %(view_user_source)s
+            ), inherited AS (
+                SELECT id AS article_id FROM knowledge_article
+                 WHERE inherited_permission IN %(perms)s
+                EXCEPT
+                SELECT kam.article_id
+                  FROM knowledge_article_member kam
+                 WHERE kam.partner_id = %(partner_id)s
+                   AND kam.permission = 'none'
+            )
+            SELECT article_id FROM direct_grants
+            %(inherited_source)s)
+        """,
+            partner_id=partner_id,
+            user_id=user.id,
+            perms=tuple(required_perms),
+            view_dept_source=view_dept_source,
+            view_user_source=view_user_source,
+            inherited_source=inherited_source,
+        )
 
     # ---- Category ----------------------------------------------------
 
     @api.depends('root_article_id.internal_permission',
-                 'root_article_id.article_member_ids.permission')
+                 'root_article_id.article_member_ids.permission',
+                 'root_article_id.view_department_ids',
+                 'root_article_id.edit_department_ids',
+                 'root_article_id.view_user_ids',
+                 'root_article_id.edit_user_ids')
     def _compute_category(self):
         """Categorise articles:
         * workspace — root internal_permission is not 'none'
-        * shared   — root has >1 member with access, or has department/user grants
-        * private  — root has 'none' internal_permission and at most one member
+        * shared   — root has >1 grant (members with access plus
+          department/user grants)
+        * private  — root has 'none' internal_permission and at most one grant
         """
         workspace = self.filtered(
             lambda a: a.root_article_id.internal_permission != 'none'
@@ -730,17 +881,53 @@ class KnowledgeArticle(models.Model):
         if not remaining:
             return
 
-        results = self.env['knowledge.article.member']._read_group(
-            [('article_id', 'in', remaining.root_article_id.ids),
-             ('permission', '!=', 'none')],
-            ['article_id'],
-            ['__count'],
-        )
-        access_count_by_root = {article.id: count for article, count in results}
+        # One aggregate over all grant sources — the previous member-only
+        # read_group ignored department/user grants despite the documented
+        # semantics.
+        grants_by_root = {}
+        root_ids = remaining.root_article_id.ids
+        if root_ids:
+            self.env['knowledge.article.member'].flush_model(
+                ['article_id', 'permission']
+            )
+            self.flush_model([
+                'view_department_ids', 'edit_department_ids',
+                'view_user_ids', 'edit_user_ids',
+            ])
+            self.env.cr.execute(SQL("""
+                SELECT root.id,
+                       COALESCE(m.cnt, 0) + COALESCE(vd.cnt, 0)
+                       + COALESCE(ed.cnt, 0) + COALESCE(vu.cnt, 0)
+                       + COALESCE(eu.cnt, 0) AS grants
+                  FROM knowledge_article root
+                  LEFT JOIN (SELECT article_id, COUNT(*) AS cnt
+                               FROM knowledge_article_member
+                              WHERE permission <> 'none'
+                                AND article_id IN %(root_ids)s
+                              GROUP BY article_id) m ON m.article_id = root.id
+                  LEFT JOIN (SELECT article_id, COUNT(*) AS cnt
+                               FROM knowledge_article_view_dept_rel
+                              WHERE article_id IN %(root_ids)s
+                              GROUP BY article_id) vd ON vd.article_id = root.id
+                  LEFT JOIN (SELECT article_id, COUNT(*) AS cnt
+                               FROM knowledge_article_edit_dept_rel
+                              WHERE article_id IN %(root_ids)s
+                              GROUP BY article_id) ed ON ed.article_id = root.id
+                  LEFT JOIN (SELECT article_id, COUNT(*) AS cnt
+                               FROM knowledge_article_view_user_rel
+                              WHERE article_id IN %(root_ids)s
+                              GROUP BY article_id) vu ON vu.article_id = root.id
+                  LEFT JOIN (SELECT article_id, COUNT(*) AS cnt
+                               FROM knowledge_article_edit_user_rel
+                              WHERE article_id IN %(root_ids)s
+                              GROUP BY article_id) eu ON eu.article_id = root.id
+                 WHERE root.id IN %(root_ids)s
+            """, root_ids=tuple(root_ids)))
+            grants_by_root = dict(self.env.cr.fetchall())
 
         for article in remaining:
             root_id = article.root_article_id.id
-            if access_count_by_root.get(root_id, 0) > 1:
+            if grants_by_root.get(root_id, 0) > 1:
                 article.category = 'shared'
             else:
                 article.category = 'private'
@@ -749,19 +936,35 @@ class KnowledgeArticle(models.Model):
 
     @api.depends('child_ids', 'child_ids.is_article_item')
     def _compute_has_article_children(self):
-        results = self.env['knowledge.article']._read_group(
-            [('parent_id', 'in', self.ids), ('is_article_item', '=', False)],
-            ['parent_id'],
-            ['__count'],
-        )
-        parents_with_children = {parent.id for parent, _count in results}
+        # Grouped probe on the partial (parent_id WHERE NOT is_article_item)
+        # index: no counting of every child row just to answer "any?".
+        parents_with_children = set()
+        if self.ids:
+            self.flush_model(['parent_id', 'is_article_item', 'active'])
+            active_clause = (
+                SQL("AND active IS TRUE")
+                if self.env.context.get('active_test', True)
+                else SQL()
+            )
+            self.env.cr.execute(SQL("""
+                SELECT parent_id
+                  FROM knowledge_article
+                 WHERE parent_id IN %(parent_ids)s
+                   AND is_article_item IS NOT TRUE
+                   %(active_clause)s
+                 GROUP BY parent_id
+            """, parent_ids=tuple(self.ids), active_clause=active_clause))
+            parents_with_children = {r[0] for r in self.env.cr.fetchall()}
         for article in self:
             article.has_article_children = article.id in parents_with_children
 
     # ---- Favorites ---------------------------------------------------
 
-    @api.depends('favorite_ids')
     def _compute_favorite_count(self):
+        """Initial population only — day-to-day maintenance is done by the
+        AFTER INSERT/DELETE trigger on knowledge_article_favorite (see
+        knowledge.article.favorite init()), which avoids a read_group
+        recount on every favorite toggle."""
         favorites = self.env['knowledge.article.favorite']._read_group(
             [('article_id', 'in', self.ids)],
             ['article_id'],
@@ -779,11 +982,20 @@ class KnowledgeArticle(models.Model):
             self.user_favorite_sequence = -1
             return
 
-        favorites = self.env['knowledge.article.favorite'].search([
-            ('article_id', 'in', self.ids),
-            ('user_id', '=', self.env.user.id),
-        ])
-        fav_map = {f.article_id.id: f.sequence for f in favorites}
+        # Straight to a dict: no favorite recordset, no per-row prefetch,
+        # no article_id dereference.
+        fav_map = {}
+        if self.ids:
+            self.env['knowledge.article.favorite'].flush_model(
+                ['article_id', 'user_id', 'sequence']
+            )
+            self.env.cr.execute(SQL("""
+                SELECT article_id, sequence
+                  FROM knowledge_article_favorite
+                 WHERE user_id = %(user_id)s
+                   AND article_id IN %(article_ids)s
+            """, user_id=self.env.user.id, article_ids=tuple(self.ids)))
+            fav_map = dict(self.env.cr.fetchall())
         for article in self:
             if article.id in fav_map:
                 article.is_user_favorite = True
@@ -795,44 +1007,143 @@ class KnowledgeArticle(models.Model):
     def _search_is_user_favorite(self, operator, value):
         if operator not in ('=', '!='):
             raise NotImplementedError("Unsupported search operation on favorite articles")
+        # Semi/anti-join on the favorite table: the subselect is handed to
+        # the planner as-is instead of materialising the user's favorite
+        # ids into a giant IN list.
+        self.env['knowledge.article.favorite'].flush_model(
+            ['article_id', 'user_id']
+        )
+        subselect = SQL("""
+            (SELECT article_id FROM knowledge_article_favorite
+              WHERE user_id = %(user_id)s)
+        """, user_id=self.env.uid)
         if (value and operator == '=') or (not value and operator == '!='):
-            return [('favorite_ids', 'in', self.env['knowledge.article.favorite'].sudo()._search(
-                [('user_id', '=', self.env.uid)]
-            ))]
-        return [('favorite_ids', 'not in', self.env['knowledge.article.favorite'].sudo()._search(
-            [('user_id', '=', self.env.uid)]
-        ))]
+            return [('id', 'in', subselect)]
+        return [('id', 'not in', subselect)]
 
     # ---- Likes -------------------------------------------------------
 
     @api.depends('liked_by_ids')
     def _compute_likes_count(self):
+        # Count in SQL: len(liked_by_ids) would load the full relation into
+        # the ORM cache just to measure it.
+        counts = {}
+        if self.ids:
+            self.flush_model(['liked_by_ids'])
+            self.env.cr.execute(SQL("""
+                SELECT article_id, COUNT(partner_id)
+                  FROM knowledge_article_likes_rel
+                 WHERE article_id IN %(article_ids)s
+                 GROUP BY article_id
+            """, article_ids=tuple(self.ids)))
+            counts = dict(self.env.cr.fetchall())
+        for article in self:
+            article.likes_count = counts.get(article.id, 0)
+
+    # ---- Body text ---------------------------------------------------
+
+    @api.depends('body')
+    def _compute_body_text(self):
+        """Keep a plain-text mirror of the body so search never has to
+        parse HTML at query time."""
+        for article in self:
+            body = article.body
+            article.body_text = (
+                tools.html2plaintext(body)
+                if body and not is_html_empty(body)
+                else ''
+            )
+
+    # ---- Permission panel cache --------------------------------------
+
+    @api.depends('name', 'icon', 'internal_permission', 'inherited_permission',
+                 'is_desynchronized', 'parent_id', 'share_token', 'is_published',
+                 'article_member_ids.partner_id', 'article_member_ids.permission',
+                 'view_department_ids', 'edit_department_ids',
+                 'view_user_ids', 'edit_user_ids')
+    def _compute_permission_panel_cache(self):
         for article in self:
-            article.likes_count = len(article.liked_by_ids)
+            article.permission_panel_cache = (
+                article._build_permission_panel_data()
+            )
+
+    def _build_permission_panel_data(self):
+        """Assemble the user-independent permission panel payload.
+
+        User-specific keys (``user_permission``, per-member
+        ``is_current_user``) are layered on top by the controller.
+        """
+        self.ensure_one()
+        members_data = [{
+            'id': member.id,
+            'partner_id': member.partner_id.id,
+            'partner_name': member.partner_id.display_name,
+            'partner_email': member.partner_id.email,
+            'partner_avatar': f'/web/image/res.partner/{member.partner_id.id}/avatar_128',
+            'permission': member.permission,
+        } for member in self.article_member_ids]
+        return {
+            'article_id': self.id,
+            'name': self.display_name,
+            'internal_permission': self.internal_permission,
+            'inherited_permission': self.inherited_permission,
+            'is_desynchronized': self.is_desynchronized,
+            'parent_id': self.parent_id.id if self.parent_id else False,
+            'parent_name': self.parent_id.display_name if self.parent_id else False,
+            'members': members_data,
+            'view_departments': [
+                {'id': d.id, 'name': d.name} for d in self.view_department_ids
+            ],
+            'edit_departments': [
+                {'id': d.id, 'name': d.name} for d in self.edit_department_ids
+            ],
+            'view_users': [
+                {'id': u.id, 'name': u.name} for u in self.view_user_ids
+            ],
+            'edit_users': [
+                {'id': u.id, 'name': u.name} for u in self.edit_user_ids
+            ],
+            'share_token': self.share_token,
+            'is_published': self.is_published,
+        }
 
     # ---- Deletion date -----------------------------------------------
 
+    @api.model
+    @tools.ormcache()
+    def _get_trash_limit_days(self):
+        """Trash retention in days, memoised in the registry cache.
+
+        ir.config_parameter writes clear the registry cache, so the memo
+        cannot go stale.
+        """
+        limit_days = self.env['ir.config_parameter'].sudo().get_param(
+            'knowledge.knowledge_article_trash_limit_days',
+        )
+        try:
+            return int(limit_days)
+        except (ValueError, TypeError):
+            return self.DEFAULT_ARTICLE_TRASH_LIMIT_DAYS
+
     @api.depends('to_delete', 'write_date')
     def _compute_deletion_date(self):
         trashed = self.filtered(lambda a: a.to_delete)
         (self - trashed).deletion_date = False
         if trashed:
-            limit_days = self.env['ir.config_parameter'].sudo().get_param(
-                'knowledge.knowledge_article_trash_limit_days',
-            )
-            try:
-                limit_days = int(limit_days)
-            except (ValueError, TypeError):
-                limit_days = self.DEFAULT_ARTICLE_TRASH_LIMIT_DAYS
+            delta = timedelta(days=self._get_trash_limit_days())
             for article in trashed:
-                article.deletion_date = article.write_date + timedelta(days=limit_days)
+                article.deletion_date = article.write_date + delta
 
     # ---- Display name ------------------------------------------------
 
     @api.depends('name', 'icon')
     def _compute_display_name(self):
+        # Warm name/icon in one SELECT and translate the sentinel once;
+        # this compute runs on every list/kanban render.
+        self.fetch(['name', 'icon'])
+        untitled = _('Untitled')
         for article in self:
-            name = article.name or _('Untitled')
+            name = article.name or untitled
             article.display_name = f"{article.icon} {name}" if article.icon else name
 
     # ==================================================================
@@ -886,18 +1197,37 @@ class KnowledgeArticle(models.Model):
             if not parent_id and not vals.get('internal_permission'):
                 vals['internal_permission'] = 'write'
 
-        # Check write access on parents
-        if parent_ids:
-            parents = self.browse(list(parent_ids))
-            for parent in parents:
-                if not parent.sudo().user_has_write_access and not self.env.su:
+        # Check write access on parents (superuser skips the whole scan —
+        # previously the computed field was evaluated per parent before the
+        # env.su test)
+        if parent_ids and not self.env.su:
+            parents_sudo = self.browse(list(parent_ids)).sudo()
+            parents_sudo.fetch(['name', 'icon'])
+            for parent in parents_sudo:
+                if not parent.user_has_write_access:
                     raise AccessError(
                         _("You cannot create an article under '%s' without write access.",
                           parent.display_name)
                     )
 
         # Compute max sequences per parent
-        max_seq_by_parent = self._get_max_sequence_inside_parents(list(parent_ids)) if parent_ids else {}
+        max_seq_by_parent = {}
+        if parent_ids:
+            if len(vals_list) == 1:
+                # Fast path for the common interactive single-create: one
+                # scalar MAX instead of the _read_group machinery.
+                parent_id = next(iter(parent_ids))
+                self.flush_model(['parent_id', 'sequence'])
+                self.env.cr.execute(SQL("""
+                    SELECT COALESCE(MAX(sequence), -1)
+                      FROM knowledge_article
+                     WHERE parent_id = %(parent_id)s
+                """, parent_id=parent_id))
+                max_seq_by_parent = {parent_id: self.env.cr.fetchone()[0]}
+            else:
+                max_seq_by_parent = self._get_max_sequence_inside_parents(
+                    list(parent_ids)
+                )
         for parent_id, group_vals in vals_by_parent.items():
             current = max_seq_by_parent.get(parent_id, -1) + 1
             for v in group_vals:
@@ -919,16 +1249,26 @@ class KnowledgeArticle(models.Model):
                 'last_edition_date': fields.Datetime.now(),
                 'last_edition_uid': self.env.user.id,
             })
-            for article in self:
-                if article.ids:
-                    self.env['knowledge.article.version'].sudo().create({
+            articles = self.filtered(lambda a: a.ids)
+            if articles:
+                # One multi-create for the snapshots and one SQL UPDATE for
+                # the version bump instead of two statements per article.
+                self.env['knowledge.article.version'].sudo().create([
+                    {
                         'article_id': article.id,
                         'content': article.body or '',
                         'version_number': article.version,
                         'user_id': self.env.user.id,
-                    })
-                    # Increment version directly to avoid recursion
-                    super(KnowledgeArticle, article).write({'version': article.version + 1})
+                    }
+                    for article in articles
+                ])
+                articles.flush_recordset(['version'])
+                self.env.cr.execute(SQL("""
+                    UPDATE knowledge_article
+                       SET version = version + 1
+                     WHERE id IN %(ids)s
+                """, ids=tuple(articles.ids)))
+                articles.invalidate_recordset(['version'])
 
         # Parent change → validate write access on new parent
         if 'parent_id' in vals:
@@ -960,69 +1300,71 @@ class KnowledgeArticle(models.Model):
         vals_list = super().copy_data(default=default)
         if default.get('name'):
             return vals_list
+        # One gettext lookup for the whole batch, not one per article.
+        template = _("%(article_name)s (copy)")
         for article, vals in zip(self, vals_list):
             if article.name:
-                vals['name'] = _("%(article_name)s (copy)", article_name=article.name)
+                vals['name'] = template % {'article_name': article.name}
         return vals_list
 
     # ==================================================================
     # SEARCH / ORDERING
     # ==================================================================
 
-    @api.model
-    def search_fetch(self, domain, field_names, offset=0, limit=None, order=None):
-        """Override to support ordering by ``is_user_favorite``.
+    def _order_to_sql(self, order, query, alias=None, reverse=False):
+        """Translate ``is_user_favorite`` order terms into an ``EXISTS`` on
+        the favorite table.
 
-        When ``is_user_favorite`` is part of the order, perform a two-step
-        search: favorites first, then the rest.
+        Favorite-first ordering then happens inside the regular search plan
+        (with proper offset/LIMIT pushdown) instead of two stitched-together
+        searches with Python-side slicing.
         """
-        if not order or 'is_user_favorite' not in order:
-            return super().search_fetch(domain, field_names, offset, limit, order)
-
-        order_items = [item.strip().lower() for item in (order or self._order).split(',')]
-        favorite_asc = any('is_user_favorite asc' in item for item in order_items)
-
-        # Step 1: user's favorites matching the domain
-        fav_domain = expression.AND([
-            [('favorite_ids.user_id', 'in', [self.env.uid])],
-            domain,
-        ])
-        fav_order = ', '.join(item for item in order_items if 'is_user_favorite' not in item)
-        fav_ids = super().search_fetch(fav_domain, field_names, order=fav_order).ids
-
-        keep = fav_ids[offset:(offset + limit)] if limit else fav_ids[offset:]
-        skip = fav_ids[:(offset + limit)] if limit else fav_ids
-
-        if limit and len(keep) >= limit:
-            return self.browse(keep)
-
-        # Step 2: remaining articles
-        other_limit = (limit - len(keep)) if limit else None
-        other_offset = max(offset - len(fav_ids), 0) if offset else 0
-        other_order = ', '.join(item for item in order_items if 'is_user_favorite' not in item)
-
-        others = super().search_fetch(
-            expression.AND([[('id', 'not in', skip)], domain]),
-            field_names,
-            other_offset,
-            other_limit,
-            other_order,
+        order = order or self._order
+        order_items = [item.strip() for item in order.split(',') if item.strip()]
+        fav_item = next(
+            (item for item in order_items
+             if item.lower().startswith('is_user_favorite')),
+            None,
+        )
+        if fav_item is None:
+            return super()._order_to_sql(order, query, alias, reverse)
+
+        asc = ' asc' in fav_item.lower()
+        if reverse:
+            asc = not asc
+        # Favorites first = boolean DESC (TRUE before FALSE)
+        exists_term = SQL(
+            "EXISTS (SELECT 1 FROM knowledge_article_favorite f "
+            "WHERE f.article_id = %(table)s.id "
+            "AND f.user_id = %(uid)s) %(direction)s",
+            table=SQL.identifier(alias or self._table),
+            uid=self.env.uid,
+            direction=SQL("ASC") if asc else SQL("DESC"),
+        )
+        rest = ', '.join(item for item in order_items if item is not fav_item)
+        if not rest:
+            return exists_term
+        return SQL(
+            "%s, %s",
+            exists_term,
+            super()._order_to_sql(rest, query, alias, reverse),
         )
-
-        if favorite_asc:
-            return others + self.browse(keep)
-        return self.browse(keep) + others
 
     @api.model
     def _read_group_stage_ids(self, stages, domain):
         """Group expand for kanban stages."""
-        search_domain = [('id', 'in', stages.ids)]
-        if self.env.context.get('default_parent_id'):
-            search_domain = expression.OR([
-                [('parent_id', '=', self.env.context['default_parent_id'])],
-                search_domain,
-            ])
-        return stages.search(search_domain)
+        default_parent_id = self.env.context.get('default_parent_id')
+        if not default_parent_id:
+            # The id-in-ids search would only re-return the stages we were
+            # handed.
+            return stages
+        # Pre-merged domain: expression.OR normalises and copies both
+        # branches just to prepend a '|'.
+        return stages.search([
+            '|',
+            ('parent_id', '=', default_parent_id),
+            ('id', 'in', stages.ids),
+        ])
 
     # ==================================================================
     # ACTIONS
@@ -1037,12 +1379,22 @@ class KnowledgeArticle(models.Model):
             'favorite_ids': [(0, 0, {'user_id': self.env.user.id})],
         })
         if to_unfav:
-            self.env['knowledge.article.favorite'].sudo().search([
-                ('article_id', 'in', to_unfav.ids),
-                ('user_id', '=', self.env.user.id),
-            ]).unlink()
-
-        self.invalidate_recordset(fnames=['is_user_favorite', 'favorite_ids'])
+            # Single keyed DELETE instead of search + unlink (two round
+            # trips plus a recordset); the favorite_count trigger still
+            # fires on the deleted rows.
+            Favorite = self.env['knowledge.article.favorite']
+            Favorite.flush_model(['article_id', 'user_id'])
+            self.env.cr.execute(SQL("""
+                DELETE FROM knowledge_article_favorite
+                 WHERE article_id = ANY(%(article_ids)s)
+                   AND user_id = %(user_id)s
+                RETURNING id
+            """, article_ids=to_unfav.ids, user_id=self.env.user.id))
+            Favorite.invalidate_model()
+
+        self.invalidate_recordset(
+            fnames=['is_user_favorite', 'favorite_ids', 'favorite_count']
+        )
         return self[0].is_user_favorite if self else False
 
     def action_toggle_like(self):
@@ -1133,12 +1485,17 @@ class KnowledgeArticle(models.Model):
 
     def _get_first_accessible_article(self):
         """Find the first article the current user can access."""
-        # Try favorites first
-        favorite = self.env['knowledge.article.favorite'].search([
+        # Accessible favorites in one query (favorite -> access chasing was
+        # previously two steps, and gave up if the first favorite happened
+        # to be inaccessible). Searching the favorite model keeps its
+        # 'sequence, id' ordering — the user's own first favorite, not
+        # the globally most-favorited article.
+        article = self.env['knowledge.article.favorite'].search([
             ('user_id', '=', self.env.user.id),
-        ], limit=1)
-        if favorite and favorite.article_id.user_has_access:
-            return favorite.article_id
+            ('article_id.user_has_access', '=', True),
+        ], limit=1).article_id
+        if article:
+            return article
 
         # Fall back to any accessible root article
         return self.search([
@@ -1167,6 +1524,9 @@ class KnowledgeArticle(models.Model):
             self.browse(parent_id) if parent_id
             else self.env['knowledge.article']
         )
+        # One SELECT for everything read below instead of one per attribute
+        # access on two separately-browsed records
+        (parent | before_article).fetch(['category', 'sequence'])
         category = category or parent.category or before_article.category
 
         if not category:
@@ -1205,16 +1565,19 @@ class KnowledgeArticle(models.Model):
         if before_article:
             vals['sequence'] = before_article.sequence
 
-        # Remove all members except current user
-        members_to_remove = self.article_member_ids.filtered(
-            lambda m: m.partner_id != self.env.user.partner_id
-        )
-        member_cmds = [(2, m.id) for m in members_to_remove]
-        if not self.article_member_ids.filtered(
-            lambda m: m.partner_id == self.env.user.partner_id
-        ):
+        # Remove all members except current user — one pass over the
+        # members instead of two filtered() scans
+        partner_id = self.env.user.partner_id.id
+        has_own_member = False
+        member_cmds = []
+        for member in self.article_member_ids:
+            if member.partner_id.id == partner_id:
+                has_own_member = True
+            else:
+                member_cmds.append((2, member.id))
+        if not has_own_member:
             member_cmds.append((0, 0, {
-                'partner_id': self.env.user.partner_id.id,
+                'partner_id': partner_id,
                 'permission': 'write',
             }))
         vals['article_member_ids'] = member_cmds
@@ -1239,37 +1602,55 @@ class KnowledgeArticle(models.Model):
 
     def _resequence(self):
         """Resequence sibling articles when duplicates exist."""
-        parent_ids = list(set(self.mapped('parent_id').ids))
-        if any(not a.parent_id for a in self):
-            parent_ids.append(False)
-
-        all_children = self.search([('parent_id', 'in', parent_ids)])
-        all_children = all_children.sorted(
-            lambda a: (
-                -1 * a.sequence,
-                a in self,
-                a.write_date,
-                a.id,
-            ),
-            reverse=True,
-        )
-
-        for pid in parent_ids:
-            siblings = all_children.filtered(lambda a: a.parent_id.id == pid)
-            sequences = siblings.mapped('sequence')
-            if len(sequences) == len(set(sequences)):
-                continue
-            # Find first duplicate
-            dup_idx = next(
-                idx for idx, s in enumerate(sequences) if s in sequences[:idx]
+        parent_ids = list(set(self.parent_id.ids))
+        include_root = any(not a.parent_id for a in self)
+
+        # One window-function UPDATE renumbers every sibling group that
+        # contains duplicate sequences, instead of a Python-side sort plus
+        # one UPDATE per child.
+        self.flush_model(['sequence', 'parent_id'])
+        root_clause = SQL("OR parent_id IS NULL") if include_root else SQL()
+        self.env.cr.execute(SQL("""
+            WITH siblings AS (
+                SELECT id, parent_id, sequence,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY parent_id
+                           ORDER BY sequence,
+                                    (id = ANY(%(moved_ids)s))::int DESC,
+                                    write_date DESC, id DESC
+                       ) AS rn
+                  FROM knowledge_article
+                 WHERE active IS TRUE
+                   AND (parent_id = ANY(%(parent_ids)s) %(root_clause)s)
+            ), duplicated AS (
+                SELECT parent_id
+                  FROM siblings
+                 GROUP BY parent_id
+                HAVING COUNT(*) <> COUNT(DISTINCT sequence)
             )
-            start_seq = sequences[dup_idx] + 1
-            for i, child in enumerate(siblings[dup_idx:]):
-                super(KnowledgeArticle, child).write({'sequence': i + start_seq})
+            UPDATE knowledge_article a
+               SET sequence = s.rn - 1
+              FROM siblings s
+              JOIN duplicated d
+                ON s.parent_id IS NOT DISTINCT FROM d.parent_id
+             WHERE a.id = s.id
+               AND a.sequence <> s.rn - 1
+        """, moved_ids=self.ids, parent_ids=parent_ids, root_clause=root_clause))
+        self.invalidate_model(['sequence'])
 
     @api.model
     def _get_max_sequence_inside_parents(self, parent_ids):
         """Return a dict {parent_id: max_sequence} for the given parents."""
+        if len(parent_ids) == 1:
+            # Single-parent common case (one article created/moved):
+            # a scalar aggregate beats the _read_group machinery.
+            self.flush_model(['parent_id', 'sequence'])
+            self.env.cr.execute(SQL("""
+                SELECT COALESCE(MAX(sequence), -1)
+                  FROM knowledge_article
+                 WHERE parent_id IS NOT DISTINCT FROM %(parent_id)s
+            """, parent_id=parent_ids[0]))
+            return {parent_ids[0]: self.env.cr.fetchone()[0]}
         if parent_ids:
             domain = [('parent_id', 'in', parent_ids)]
         else:
@@ -1298,16 +1679,13 @@ class KnowledgeArticle(models.Model):
         user = self.env.user
         Article = self.env['knowledge.article']
 
-        # ---- Root articles by category --------------------------------
-        root_domain = [
+        # ---- Root articles --------------------------------------------
+        # One search; the client partitions on the 'category' field read
+        # below, so no Python-side filtered() per category is needed.
+        all_roots = Article.search([
             ('parent_id', '=', False),
             ('user_has_access', '=', True),
-        ]
-        all_roots = Article.search(root_domain)
-
-        workspace_roots = all_roots.filtered(lambda a: a.category == 'workspace')
-        shared_roots = all_roots.filtered(lambda a: a.category == 'shared')
-        private_roots = all_roots.filtered(lambda a: a.category == 'private')
+        ])
 
         # ---- Favorites ------------------------------------------------
         favorites = self.env['knowledge.article.favorite'].search([
@@ -1315,27 +1693,24 @@ class KnowledgeArticle(models.Model):
         ])
         favorite_articles = favorites.article_id.filtered(lambda a: a.active and a.user_has_access)
 
-        # ---- Children of unfolded articles ----------------------------
+        # ---- Children of unfolded articles (and of the ancestors of the
+        # current article) in a single search -----------------------------
+        unfold_ids = set(unfolded_ids)
+        if self and self.parent_id:
+            unfold_ids |= self._get_ancestor_ids()
+
         unfolded_children = Article.browse()
-        if unfolded_ids:
+        if unfold_ids:
             unfolded_children = Article.search([
-                ('parent_id', 'in', unfolded_ids),
-                ('is_article_item', '=', False),
-                ('user_has_access', '=', True),
-            ])
-
-        # If current article is set, also unfold ancestors
-        if self and self.parent_id:
-            ancestor_ids = self._get_ancestor_ids()
-            extra_children = Article.search([
-                ('parent_id', 'in', list(ancestor_ids)),
+                ('parent_id', 'in', list(unfold_ids)),
                 ('is_article_item', '=', False),
                 ('user_has_access', '=', True),
             ])
-            unfolded_children |= extra_children
 
         # ---- Build result sets ----------------------------------------
-        all_articles = workspace_roots | shared_roots | private_roots | favorite_articles | unfolded_children
+        all_articles = Article.browse(
+            set(all_roots.ids) | set(favorite_articles.ids) | set(unfolded_children.ids)
+        )
 
         fields_to_read = [
             'id', 'name', 'icon', 'parent_id', 'has_article_children',
@@ -1359,22 +1734,30 @@ class KnowledgeArticle(models.Model):
                 ('is_user_favorite', '=', True),
             ], limit=limit).read(['id', 'name', 'icon'])
 
-        # Escape ILIKE special characters
-        pattern = '%' + re.sub(r'(%|_|\\)', r'\\\1', search_term) + '%'
+        if len(search_term) >= 3:
+            # Both leaves are served by the pg_trgm GIN indexes on name
+            # and body_text (index='trigram').
+            match_domain = [
+                '|',
+                ('name', 'ilike', search_term),
+                ('body_text', 'ilike', search_term),
+            ]
+        else:
+            # Trigram indexes need at least 3 characters; fall back to a
+            # name-prefix match instead of an unindexable ILIKE scan.
+            prefix = _ILIKE_ESCAPE_RE.sub(r'\\\1', search_term) + '%'
+            match_domain = [('name', '=ilike', prefix)]
 
-        domain = [
-            ('user_has_access', '=', True),
-            '|',
-            ('name', 'ilike', search_term),
-            ('body', 'ilike', search_term),
-        ]
+        domain = [('user_has_access', '=', True)] + match_domain
         articles = self.search(domain, limit=limit)
 
+        # Snippets come from the stored plain-text mirror — no HTML parse
+        # per hit at query time.
         result = []
         for article in articles:
             snippet = ''
-            if article.body and not is_html_empty(article.body):
-                text = BeautifulSoup(article.body, 'html.parser').get_text(' ', strip=True)
+            text = article.body_text or ''
+            if text:
                 lower_text = text.lower()
                 pos = lower_text.find(search_term.lower())
                 if pos >= 0:
@@ -1410,25 +1793,29 @@ class KnowledgeArticle(models.Model):
         if isinstance(partner_ids, models.BaseModel):
             partner_ids = partner_ids.ids
 
-        existing = self.env['knowledge.article.member'].sudo().search([
+        Member = self.env['knowledge.article.member'].sudo()
+        existing = Member.search([
             ('article_id', '=', self.id),
             ('partner_id', 'in', partner_ids),
         ])
-        existing_partner_ids = existing.mapped('partner_id').ids
-
-        # Update existing
-        for member in existing:
-            if ARTICLE_PERMISSION_LEVEL.get(permission, 0) > ARTICLE_PERMISSION_LEVEL.get(member.permission, 0):
-                member.permission = permission
-
-        # Create new
-        new_partners = set(partner_ids) - set(existing_partner_ids)
-        for pid in new_partners:
-            self.env['knowledge.article.member'].sudo().create({
-                'article_id': self.id,
-                'partner_id': pid,
-                'permission': permission,
-            })
+
+        # Upgrade existing members in one write
+        permission_level = ARTICLE_PERMISSION_LEVEL.get(permission, 0)
+        existing.filtered(
+            lambda m: permission_level > _PERM_LEVEL[m.permission]
+        ).write({'permission': permission})
+
+        # Create new members in one multi-create
+        new_partners = set(partner_ids) - set(existing.partner_id.ids)
+        if new_partners:
+            Member.create([
+                {
+                    'article_id': self.id,
+                    'partner_id': pid,
+                    'permission': permission,
+                }
+                for pid in new_partners
+            ])
 
     def _set_internal_permission(self, permission):
         """Set the internal_permission and desync if this is a child article."""
@@ -1462,6 +1849,9 @@ class KnowledgeArticle(models.Model):
         if not self.ids:
             return {}
 
+        # DISTINCT ON lets Postgres pick the closest ancestor (highest
+        # ancestor_id) per article, so exactly one row per article crosses
+        # the wire instead of O(depth) rows plus a Python max-loop.
         self.env.cr.execute(SQL("""
             WITH article_ancestors AS (
                 SELECT a.id AS article_id,
@@ -1469,27 +1859,17 @@ class KnowledgeArticle(models.Model):
                   FROM knowledge_article a
                  WHERE a.id IN %(article_ids)s
             )
-            SELECT aa.article_id,
-                   kam.permission,
-                   aa.ancestor_id
+            SELECT DISTINCT ON (aa.article_id)
+                   aa.article_id,
+                   kam.permission
               FROM article_ancestors aa
               JOIN knowledge_article_member kam
                 ON kam.article_id = aa.ancestor_id
                AND kam.partner_id = %(partner_id)s
+             ORDER BY aa.article_id, aa.ancestor_id DESC
         """, article_ids=tuple(self.ids), partner_id=partner.id))
 
-        rows = self.env.cr.fetchall()
-        if not rows:
-            return {}
-
-        # For each article, pick the closest ancestor's permission
-        # (the one with the highest ancestor_id — closer in the tree)
-        result = {}
-        for article_id, permission, ancestor_id in rows:
-            if article_id not in result or ancestor_id > result[article_id][1]:
-                result[article_id] = (permission, ancestor_id)
-
-        return {aid: perm for aid, (perm, _) in result.items()}
+        return dict(self.env.cr.fetchall())
 
     # ==================================================================
     # HIERARCHY HELPERS
@@ -1585,17 +1965,18 @@ class KnowledgeArticle(models.Model):
     @api.autovacuum
     def _gc_trashed_articles(self):
         """Delete articles that have been in trash beyond the configured limit."""
-        limit_days = self.env['ir.config_parameter'].sudo().get_param(
-            'knowledge.knowledge_article_trash_limit_days',
-        )
-        try:
-            limit_days = int(limit_days)
-        except (ValueError, TypeError):
-            limit_days = self.DEFAULT_ARTICLE_TRASH_LIMIT_DAYS
-
-        cutoff = datetime.utcnow() - timedelta(days=limit_days)
+        cutoff = datetime.utcnow() - timedelta(days=self._get_trash_limit_days())
         domain = [
             ('write_date', '<', cutoff),
             ('to_delete', '=', True),
         ]
-        return self.with_context(active_test=False).search(domain, limit=100).unlink()
+        # Chunked loop: the previous single limit=100 pass left large trash
+        # backlogs lingering for days, while unbounded unlinks blow up the
+        # cascade/constraint work per statement.
+        articles = self.with_context(active_test=False)
+        while True:
+            batch = articles.search(domain, limit=1000)
+            if not batch:
+                break
+            batch.unlink()
+        return True
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from psycopg2.extras import execute_values
+
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
@@ -26,9 +28,11 @@ class KnowledgeArticleFavorite(models.Model):
         index=True,
         default=lambda self: self.env.uid,
     )
+    # Deliberately not stored: a stored related would rewrite every
+    # favorite row whenever an article is (un)archived. Domains filter
+    # on article_id.active instead, which the ORM joins.
     is_article_active = fields.Boolean(
         related='article_id.active',
-        store=True,
     )
     sequence = fields.Integer(default=0)
 
@@ -40,6 +44,52 @@ class KnowledgeArticleFavorite(models.Model):
         ),
     ]
 
+    # ------------------------------------------------------------------
+    # INIT — favorite_count maintenance trigger
+    # ------------------------------------------------------------------
+
+    def init(self):
+        """Maintain knowledge_article.favorite_count at the source.
+
+        An AFTER INSERT/DELETE trigger increments/decrements the stored
+        counter, so toggling a favorite costs one keyed UPDATE instead of
+        a read_group recount over the whole favorite table — the counter
+        drives the default article ordering, so it is written often.
+        """
+        super().init()
+        self.env.cr.execute("""
+            CREATE OR REPLACE FUNCTION knowledge_article_fav_tg()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    UPDATE knowledge_article
+                       SET favorite_count = favorite_count + 1
+                     WHERE id = NEW.article_id;
+                ELSIF TG_OP = 'DELETE' THEN
+                    UPDATE knowledge_article
+                       SET favorite_count = favorite_count - 1
+                     WHERE id = OLD.article_id;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        self.env.cr.execute(
+            "DROP TRIGGER IF EXISTS knowledge_article_fav_tg_trg "
+            "ON knowledge_article_favorite"
+        )
+        self.env.cr.execute(
+            "CREATE TRIGGER knowledge_article_fav_tg_trg "
+            "AFTER INSERT OR DELETE ON knowledge_article_favorite "
+            "FOR EACH ROW EXECUTE FUNCTION knowledge_article_fav_tg()"
+        )
+        # Serves the per-user MAX(sequence) aggregate in create() and the
+        # sequence-ordered sidebar reads.
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_favorite_user_seq_idx "
+            "ON knowledge_article_favorite (user_id, sequence DESC)"
+        )
+
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
@@ -49,15 +99,23 @@ class KnowledgeArticleFavorite(models.Model):
         """Auto-assign sequence as max + 1 for each user."""
         if isinstance(vals_list, dict):
             vals_list = [vals_list]
-        for vals in vals_list:
-            if 'sequence' not in vals:
+        missing = [vals for vals in vals_list if 'sequence' not in vals]
+        if missing:
+            # One grouped aggregate for every user in the batch instead
+            # of one ordered search per new favorite.
+            user_ids = {vals.get('user_id', self.env.uid) for vals in missing}
+            self.flush_model(['user_id', 'sequence'])
+            self.env.cr.execute(
+                "SELECT user_id, MAX(sequence) "
+                "FROM knowledge_article_favorite "
+                "WHERE user_id = ANY(%s) GROUP BY user_id",
+                [list(user_ids)],
+            )
+            next_seq = {uid: max_seq + 1 for uid, max_seq in self.env.cr.fetchall()}
+            for vals in missing:
                 user_id = vals.get('user_id', self.env.uid)
-                max_seq = self.sudo().search(
-                    [('user_id', '=', user_id)],
-                    order='sequence desc',
-                    limit=1,
-                ).sequence or 0
-                vals['sequence'] = max_seq + 1
+                vals['sequence'] = next_seq.get(user_id, 1)
+                next_seq[user_id] = vals['sequence'] + 1
         return super().create(vals_list)
 
     def write(self, vals):
@@ -78,8 +136,20 @@ class KnowledgeArticleFavorite(models.Model):
             ('user_id', '=', self.env.uid),
             ('article_id', 'in', article_ids),
         ])
-        fav_by_article = {f.article_id.id: f for f in favorites}
-        for idx, article_id in enumerate(article_ids):
-            fav = fav_by_article.get(article_id)
-            if fav:
-                fav.sequence = idx
+        fav_by_article = {f.article_id.id: f.id for f in favorites}
+        rows = [
+            (idx, fav_by_article[article_id])
+            for idx, article_id in enumerate(article_ids)
+            if article_id in fav_by_article
+        ]
+        if not rows:
+            return
+        # One set-oriented UPDATE instead of one write per dragged favorite.
+        favorites.flush_recordset(['sequence'])
+        execute_values(
+            self.env.cr,
+            "UPDATE knowledge_article_favorite AS f SET sequence = v.seq "
+            "FROM (VALUES %s) AS v(seq, id) WHERE f.id = v.id",
+            rows,
+        )
+        favorites.invalidate_recordset(['sequence'])
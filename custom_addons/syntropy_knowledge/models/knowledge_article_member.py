@@ -56,6 +56,24 @@ class KnowledgeArticleMember(models.Model):
         ),
     ]
 
+    # ------------------------------------------------------------------
+    # INIT
+    # ------------------------------------------------------------------
+
+    def init(self):
+        super().init()
+        # Partial index backing the writer-existence checks below.
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_member_article_write_idx "
+            "ON knowledge_article_member (article_id) WHERE permission = 'write'"
+        )
+        # Member grant probe of the accessible-article lookup (see
+        # KnowledgeArticle._accessible_article_ids_sql).
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_member_partner_perm_idx "
+            "ON knowledge_article_member (partner_id, permission)"
+        )
+
     # ------------------------------------------------------------------
     # Constraints
     # ------------------------------------------------------------------
@@ -63,12 +81,22 @@ class KnowledgeArticleMember(models.Model):
     @api.constrains('permission', 'article_id')
     def _check_is_writable(self):
         """Every article must always have at least one writer."""
-        article_ids = self.mapped('article_id')
-        for article in article_ids:
-            writers = article.article_member_ids.filtered(
-                lambda m: m.permission == 'write'
-            )
-            if not writers and article.internal_permission != 'write':
+        articles = self.article_id
+        # One grouped query for every touched article instead of scanning
+        # each article's full membership in Python.
+        self.flush_model(['article_id', 'permission'])
+        self.env.cr.execute(
+            "SELECT article_id FROM knowledge_article_member "
+            "WHERE article_id = ANY(%s) AND permission = 'write' "
+            "GROUP BY article_id",
+            [articles.ids],
+        )
+        writer_ids = {row[0] for row in self.env.cr.fetchall()}
+        # One warming SELECT for every article in the batch; without it
+        # the loop below faults the cache article by article.
+        articles.fetch(['internal_permission'])
+        for article in articles:
+            if article.id not in writer_ids and article.internal_permission != 'write':
                 raise ValidationError(
                     _("Article '%s' must have at least one user with write access.", article.display_name)
                 )
@@ -87,15 +115,24 @@ class KnowledgeArticleMember(models.Model):
 
     def unlink(self):
         """Prevent removing the last writer from an article."""
-        for member in self:
-            if member.permission == 'write':
-                remaining_writers = member.article_id.article_member_ids.filtered(
-                    lambda m: m.permission == 'write' and m.id != member.id
-                )
-                has_internal_write = member.article_id.internal_permission == 'write'
-                if not remaining_writers and not has_internal_write:
+        writers = self.filtered(lambda m: m.permission == 'write')
+        if writers:
+            articles = writers.article_id
+            # Count the writers surviving this unlink per article in one
+            # aggregate, instead of re-filtering each article's members.
+            self.flush_model(['article_id', 'permission'])
+            self.env.cr.execute(
+                "SELECT article_id, COUNT(*) FROM knowledge_article_member "
+                "WHERE article_id = ANY(%s) AND permission = 'write' "
+                "AND id <> ALL(%s) GROUP BY article_id",
+                [articles.ids, self.ids],
+            )
+            remaining = dict(self.env.cr.fetchall())
+            articles.fetch(['internal_permission'])
+            for article in articles:
+                if not remaining.get(article.id) and article.internal_permission != 'write':
                     raise ValidationError(
-                        _("Cannot remove the last writer from article '%s'.", member.article_id.display_name)
+                        _("Cannot remove the last writer from article '%s'.", article.display_name)
                     )
         return super().unlink()
 
@@ -103,13 +140,27 @@ class KnowledgeArticleMember(models.Model):
     # Business methods
     # ------------------------------------------------------------------
 
+    def _get_invitation_hashes(self):
+        """Return ``{member_id: invitation hash}`` for the whole recordset.
+
+        The config parameter is fetched once and article/partner ids are
+        prefetched together, so hashing a batch of invitees costs one
+        parameter lookup instead of one per member.
+        """
+        secret = self.env['ir.config_parameter'].sudo().get_param(
+            'database.secret', '',
+        ).encode()
+        self.fetch(['article_id', 'partner_id'])
+        return {
+            member.id: hmac.new(
+                secret,
+                f'{member.id}-{member.article_id.id}-{member.partner_id.id}'.encode(),
+                hashlib.sha256,
+            ).hexdigest()[:16]
+            for member in self
+        }
+
     def _get_invitation_hash(self):
         """Generate an HMAC-based hash for email invitation validation."""
         self.ensure_one()
-        secret = self.env['ir.config_parameter'].sudo().get_param('database.secret', '')
-        message = f'{self.id}-{self.article_id.id}-{self.partner_id.id}'
-        return hmac.new(
-            secret.encode(),
-            message.encode(),
-            hashlib.sha256,
-        ).hexdigest()[:16]
+        return self._get_invitation_hashes()[self.id]
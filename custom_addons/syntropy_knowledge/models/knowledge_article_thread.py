@@ -33,6 +33,19 @@ class KnowledgeArticleThread(models.Model):
         tracking=True,
     )
 
+    # ------------------------------------------------------------------
+    # INIT
+    # ------------------------------------------------------------------
+
+    def init(self):
+        super().init()
+        # Backs both the default 'write_date desc, id desc' ordering and
+        # the common "threads of this article, newest first" fetch.
+        self.env.cr.execute(
+            "CREATE INDEX IF NOT EXISTS knowledge_article_thread_article_write_idx "
+            "ON knowledge_article_thread (article_id, write_date DESC, id DESC)"
+        )
+
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
@@ -43,8 +56,11 @@ class KnowledgeArticleThread(models.Model):
         if isinstance(vals_list, dict):
             vals_list = [vals_list]
         for vals in vals_list:
-            if vals.get('article_anchor_text'):
-                vals['article_anchor_text'] = vals['article_anchor_text'][:1200]
+            anchor = vals.get('article_anchor_text')
+            # Slice only when actually over the limit — no new string for
+            # the common short-anchor case.
+            if anchor and len(anchor) > 1200:
+                vals['article_anchor_text'] = anchor[:1200]
         return super().create(vals_list)
 
     def write(self, vals):
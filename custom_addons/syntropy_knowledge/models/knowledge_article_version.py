@@ -1,11 +1,35 @@
 # -*- coding: utf-8 -*-
 
 import difflib
+import os
 
-from markupsafe import Markup
+from markupsafe import Markup, escape
+
+try:
+    from cdifflib import CSequenceMatcher
+except ImportError:
+    CSequenceMatcher = None
 
 from odoo import api, fields, models, _
 
+# 'auto' (default) uses cdifflib for large inputs when available;
+# 'htmldiff' forces the stdlib path.
+DIFF_BACKEND = os.environ.get('SYNTROPY_DIFF_BACKEND', 'auto')
+
+# Built once at import; every rendered diff reuses the same Markup.
+DIFF_STYLES = Markup("""
+<style>
+    .diff_header { background-color: #e0e0e0; padding: 4px 8px; }
+    .diff_next { background-color: #c0c0c0; }
+    .diff_add { background-color: #aaffaa; }
+    .diff_chg { background-color: #ffff77; }
+    .diff_sub { background-color: #ffaaaa; }
+    table.diff { font-family: monospace; border-collapse: collapse; width: 100%; }
+    table.diff td { padding: 2px 6px; white-space: pre-wrap; word-break: break-word; }
+    table.diff th { padding: 4px 8px; text-align: left; }
+</style>
+""")
+
 
 class KnowledgeArticleVersion(models.Model):
     """Snapshots of a knowledge article body at a specific version."""
@@ -37,8 +61,11 @@ class KnowledgeArticleVersion(models.Model):
     )
 
     def _compute_display_name(self):
+        # One warming SELECT and one gettext lookup for the whole list.
+        self.fetch(['version_number'])
+        template = _("Version %d")
         for rec in self:
-            rec.display_name = _("Version %d", rec.version_number)
+            rec.display_name = template % rec.version_number
 
     # ------------------------------------------------------------------
     # Actions
@@ -47,17 +74,19 @@ class KnowledgeArticleVersion(models.Model):
     def action_compare_with_current(self):
         """Open a comparison wizard between this version and the current body."""
         self.ensure_one()
-        wizard = self.env['knowledge.version.compare.wizard'].create({
-            'article_id': self.article_id.id,
-            'old_version_id': self.id,
-        })
+        # No create() here: the form loader instantiates the transient
+        # record on demand, so the diff is only computed when the form
+        # actually pulls diff_html.
         return {
             'type': 'ir.actions.act_window',
             'name': _('Compare Versions'),
             'res_model': 'knowledge.version.compare.wizard',
-            'res_id': wizard.id,
             'view_mode': 'form',
             'target': 'new',
+            'context': {
+                'default_article_id': self.article_id.id,
+                'default_old_version_id': self.id,
+            },
         }
 
     def action_compare_selected_versions(self):
@@ -65,18 +94,17 @@ class KnowledgeArticleVersion(models.Model):
         if len(self) != 2:
             return
         versions = self.sorted('version_number')
-        wizard = self.env['knowledge.version.compare.wizard'].create({
-            'article_id': versions[0].article_id.id,
-            'old_version_id': versions[0].id,
-            'current_version_id': versions[1].id,
-        })
         return {
             'type': 'ir.actions.act_window',
             'name': _('Compare Versions'),
             'res_model': 'knowledge.version.compare.wizard',
-            'res_id': wizard.id,
             'view_mode': 'form',
             'target': 'new',
+            'context': {
+                'default_article_id': versions[0].article_id.id,
+                'default_old_version_id': versions[0].id,
+                'default_current_version_id': versions[1].id,
+            },
         }
 
 
@@ -110,18 +138,32 @@ class KnowledgeVersionCompareWizard(models.TransientModel):
     )
     diff_html = fields.Html(
         string="Diff",
-        compute='_compute_contents',
+        compute='_compute_diff_html',
         sanitize=False,
     )
 
     @api.depends('old_version_id', 'current_version_id', 'article_id')
     def _compute_contents(self):
+        # content is prefetch=False, so each dereference below would
+        # otherwise SELECT one blob at a time; one explicit fetch batches
+        # them for every version involved.
+        versions = self.old_version_id | self.current_version_id
+        if versions:
+            versions.fetch(['content'])
         for wizard in self:
             wizard.old_content = wizard.old_version_id.content or ''
             if wizard.current_version_id:
                 wizard.current_content = wizard.current_version_id.content or ''
             else:
                 wizard.current_content = wizard.article_id.body or ''
+
+    @api.depends('old_content', 'current_content')
+    def _compute_diff_html(self):
+        for wizard in self:
+            # Equal bodies: skip the diff algorithm entirely.
+            if (wizard.old_content or '') == (wizard.current_content or ''):
+                wizard.diff_html = Markup('<div>%s</div>') % _("No changes")
+                continue
             wizard.diff_html = wizard._generate_diff_html()
 
     def _generate_diff_html(self):
@@ -129,30 +171,73 @@ class KnowledgeVersionCompareWizard(models.TransientModel):
         self.ensure_one()
         old_text = (self.old_content or '').splitlines()
         new_text = (self.current_content or '').splitlines()
-
-        diff = difflib.HtmlDiff(wrapcolumn=80)
-        diff_table = diff.make_table(
-            old_text,
-            new_text,
-            fromdesc=_("Version %d", self.old_version_id.version_number),
-            todesc=(
-                _("Version %d", self.current_version_id.version_number)
-                if self.current_version_id
-                else _("Current")
-            ),
-            context=True,
-            numlines=3,
+        fromdesc = _("Version %d", self.old_version_id.version_number)
+        todesc = (
+            _("Version %d", self.current_version_id.version_number)
+            if self.current_version_id
+            else _("Current")
         )
-        styles = Markup("""
-        <style>
-            .diff_header { background-color: #e0e0e0; padding: 4px 8px; }
-            .diff_next { background-color: #c0c0c0; }
-            .diff_add { background-color: #aaffaa; }
-            .diff_chg { background-color: #ffff77; }
-            .diff_sub { background-color: #ffaaaa; }
-            table.diff { font-family: monospace; border-collapse: collapse; width: 100%; }
-            table.diff td { padding: 2px 6px; white-space: pre-wrap; word-break: break-word; }
-            table.diff th { padding: 4px 8px; text-align: left; }
-        </style>
-        """)
-        return Markup(styles) + Markup(diff_table)
+
+        if (
+            CSequenceMatcher is not None
+            and DIFF_BACKEND != 'htmldiff'
+            and max(len(old_text), len(new_text)) >= 200
+        ):
+            # HtmlDiff is pure Python and quadratic on large inputs; for
+            # big articles render the table from C-computed opcodes.
+            diff_table = self._render_diff_table(
+                old_text, new_text, fromdesc, todesc,
+            )
+        else:
+            diff = difflib.HtmlDiff(wrapcolumn=80)
+            diff_table = diff.make_table(
+                old_text,
+                new_text,
+                fromdesc=fromdesc,
+                todesc=todesc,
+                context=True,
+                numlines=3,
+            )
+        return DIFF_STYLES + Markup(diff_table)
+
+    @api.model
+    def _render_diff_table(self, old_lines, new_lines, fromdesc, todesc):
+        """Two-column diff table built from SequenceMatcher opcodes.
+
+        Keeps three lines of context around changes like
+        ``HtmlDiff(context=True, numlines=3)``, but skips HtmlDiff's
+        pure-Python formatting pass entirely — the matching runs in C
+        (cdifflib) and the rows are plain string joins.
+        """
+        row = Markup('<tr><td class="%s">%s</td><td class="%s">%s</td></tr>')
+        gap = Markup('<tr><td class="diff_next" colspan="2">...</td></tr>')
+        cells = []
+        # autojunk=False: skip the popularity heuristic scan, which buys
+        # nothing on HTML lines and costs a full pass over long inputs.
+        matcher = CSequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                block = old_lines[i1:i2]
+                if len(block) > 6:
+                    cells.extend(row % ('', line, '', line) for line in block[:3])
+                    cells.append(gap)
+                    cells.extend(row % ('', line, '', line) for line in block[-3:])
+                else:
+                    cells.extend(row % ('', line, '', line) for line in block)
+            elif tag == 'replace':
+                for offset in range(max(i2 - i1, j2 - j1)):
+                    old = old_lines[i1 + offset] if i1 + offset < i2 else ''
+                    new = new_lines[j1 + offset] if j1 + offset < j2 else ''
+                    cells.append(row % ('diff_chg', old, 'diff_chg', new))
+            elif tag == 'delete':
+                cells.extend(
+                    row % ('diff_sub', line, '', '') for line in old_lines[i1:i2]
+                )
+            else:  # insert
+                cells.extend(
+                    row % ('', '', 'diff_add', line) for line in new_lines[j1:j2]
+                )
+        return (
+            Markup('<table class="diff"><tr><th>%s</th><th>%s</th></tr>')
+            % (escape(fromdesc), escape(todesc))
+        ) + Markup('').join(cells) + Markup('</table>')
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from odoo import fields, models
+from psycopg2.extras import execute_values
+
+from odoo import api, fields, models
 
 
 class KnowledgeArticleViewLog(models.Model):
@@ -25,4 +27,100 @@ class KnowledgeArticleViewLog(models.Model):
     viewed_on = fields.Datetime(
         string="Viewed On",
         default=fields.Datetime.now,
+        index=True,
     )
+
+    @api.model
+    def _log_views(self, article_ids, user_id=None, ts=None):
+        """Append view-log rows for the given articles in one INSERT.
+
+        The log is append-only analytics data: it needs no defaults
+        machinery, tracking or recompute triggers, so bursts of views
+        are inserted with a single execute_values instead of the ORM's
+        per-row create path. Single-row calls keep using create().
+        """
+        if not article_ids:
+            return
+        user_id = user_id or self.env.uid
+        ts = ts or fields.Datetime.now()
+        if len(article_ids) == 1:
+            self.create({
+                'article_id': article_ids[0],
+                'user_id': user_id,
+                'viewed_on': ts,
+            })
+            return
+        execute_values(
+            self.env.cr,
+            "INSERT INTO knowledge_article_view_log "
+            "(article_id, user_id, viewed_on, "
+            " create_uid, create_date, write_uid, write_date) "
+            "VALUES %s",
+            [
+                (article_id, user_id, ts, user_id, ts, user_id, ts)
+                for article_id in article_ids
+            ],
+        )
+
+
+class KnowledgeArticleViewLogHourly(models.Model):
+    """Hourly rollup of article views.
+
+    High-traffic instances generate one view-log row per click; analytics
+    only need per-hour granularity, so views are bucketed per
+    (article, user, hour) via an UPSERT that turns repeat views into a
+    counter update instead of a new row.
+    """
+
+    _name = 'knowledge.article.view.log.hourly'
+    _description = 'Knowledge Article View Log (Hourly Rollup)'
+    _order = 'hour desc'
+
+    article_id = fields.Many2one(
+        'knowledge.article',
+        string="Article",
+        required=True,
+        ondelete='cascade',
+        index=True,
+    )
+    user_id = fields.Many2one(
+        'res.users',
+        string="User",
+        required=True,
+        ondelete='cascade',
+    )
+    hour = fields.Datetime(
+        string="Hour",
+        required=True,
+        help="Start of the hour bucket.",
+    )
+    count = fields.Integer(
+        string="Views",
+        default=1,
+    )
+
+    _sql_constraints = [
+        (
+            'unique_article_user_hour',
+            'UNIQUE(article_id, user_id, hour)',
+            'A view bucket already exists for this article, user and hour.',
+        ),
+    ]
+
+    @api.model
+    def _bump(self, article_id, user_id):
+        """Record one view in the current hour bucket (UPSERT)."""
+        self.env.cr.execute(
+            """
+            INSERT INTO knowledge_article_view_log_hourly
+                (article_id, user_id, hour, count,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%(article_id)s, %(user_id)s, date_trunc('hour', NOW()), 1,
+                    %(user_id)s, NOW(), %(user_id)s, NOW())
+            ON CONFLICT (article_id, user_id, hour)
+            DO UPDATE SET count = knowledge_article_view_log_hourly.count + 1,
+                          write_uid = %(user_id)s,
+                          write_date = NOW()
+            """,
+            {'article_id': article_id, 'user_id': user_id},
+        )
@@ -9,6 +9,8 @@ class KnowledgeCategory(models.Model):
     _name = 'knowledge.category'
     _description = 'Knowledge Category'
     _order = 'name'
+    _parent_name = 'parent_id'
+    _parent_store = True
 
     name = fields.Char(required=True, translate=True)
     parent_id = fields.Many2one(
@@ -17,6 +19,7 @@ class KnowledgeCategory(models.Model):
         ondelete='cascade',
         index=True,
     )
+    parent_path = fields.Char(index=True, unaccent=False)
     child_ids = fields.One2many(
         'knowledge.category',
         'parent_id',
@@ -24,10 +27,30 @@ class KnowledgeCategory(models.Model):
     )
 
     def _compute_display_name(self):
+        """Build the ' / '-separated ancestor path per category.
+
+        The materialized parent_path already encodes each ancestor chain
+        root-first, so one batched name read covers the whole recordset —
+        no tree walk, in SQL or in Python."""
+        ancestor_ids = {
+            int(node_id)
+            for rec in self if rec.parent_path
+            for node_id in rec.parent_path.split('/') if node_id
+        }
+        nodes = self.browse(ancestor_ids)
+        nodes.fetch(['name'])
+        names = {node.id: node.name or '' for node in nodes}
         for rec in self:
-            names = []
-            current = rec
-            while current:
-                names.append(current.name or '')
-                current = current.parent_id
-            rec.display_name = ' / '.join(reversed(names))
+            if rec.parent_path:
+                rec.display_name = ' / '.join(
+                    names[int(node_id)]
+                    for node_id in rec.parent_path.split('/') if node_id
+                )
+            else:
+                # New records have no parent_path yet: climb the cache.
+                parts = []
+                current = rec
+                while current:
+                    parts.append(current.name or '')
+                    current = current.parent_id
+                rec.display_name = ' / '.join(reversed(parts))
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from psycopg2.extras import execute_batch
+
 from odoo import api, fields, models
 
 
@@ -31,17 +33,28 @@ class KnowledgeCover(models.Model):
         store=True,
     )
 
-    @api.depends('attachment_id', 'attachment_id.local_url')
+    @api.depends('attachment_id', 'attachment_id.url')
     def _compute_attachment_url(self):
-        for cover in self:
-            if cover.attachment_id:
-                att = cover.attachment_id
-                if att.url:
-                    cover.attachment_url = att.url
-                else:
-                    cover.attachment_url = f'/web/image/{att.id}'
-            else:
-                cover.attachment_url = False
+        records = self.filtered('id')
+        if records:
+            # Skinny join: only ir_attachment.url is read, instead of
+            # materializing full attachment records (datas included)
+            # just to look at one column.
+            records.flush_recordset(['attachment_id'])
+            self.env['ir.attachment'].flush_model(['url'])
+            self.env.cr.execute(
+                "SELECT c.id, a.id, a.url FROM knowledge_cover c "
+                "LEFT JOIN ir_attachment a ON a.id = c.attachment_id "
+                "WHERE c.id = ANY(%s)",
+                [records.ids],
+            )
+            info = {cid: (aid, url) for cid, aid, url in self.env.cr.fetchall()}
+            for cover in records:
+                att_id, url = info.get(cover.id, (None, None))
+                cover.attachment_url = url or (f'/web/image/{att_id}' if att_id else False)
+        for cover in self - records:
+            att = cover.attachment_id
+            cover.attachment_url = (att.url or f'/web/image/{att.id}') if att else False
 
     @api.model
     def create(self, vals_list):
@@ -49,16 +62,36 @@ class KnowledgeCover(models.Model):
         if isinstance(vals_list, dict):
             vals_list = [vals_list]
         records = super().create(vals_list)
-        for cover in records:
-            if cover.attachment_id:
-                cover.attachment_id.write({
-                    'res_model': 'knowledge.cover',
-                    'res_id': cover.id,
-                    'public': True,
-                })
+        pairs = [
+            (cover.id, cover.attachment_id.id)
+            for cover in records if cover.attachment_id
+        ]
+        if pairs:
+            # One fused batch UPDATE linking every attachment — shared
+            # fields and the per-row res_id in the same statement, no
+            # per-attachment ORM write()/tracking pass.
+            attachments = self.env['ir.attachment'].browse(p[1] for p in pairs)
+            attachments.flush_recordset(['res_model', 'res_id', 'public'])
+            execute_batch(
+                self.env.cr,
+                "UPDATE ir_attachment "
+                "SET res_model = 'knowledge.cover', public = TRUE, res_id = %s "
+                "WHERE id = %s",
+                pairs,
+                page_size=1000,
+            )
+            attachments.invalidate_recordset(['res_model', 'res_id', 'public'])
         return records
 
     def _gc_unused_covers(self):
         """Autovacuum: remove covers not linked to any article."""
-        orphaned = self.search([('article_ids', '=', False)])
-        orphaned.unlink()
+        # Anti-join: the ('article_ids', '=', False) domain compiles to a
+        # NOT IN subquery the planner may materialize; NOT EXISTS gets an
+        # anti-join plan instead.
+        self.env['knowledge.article'].flush_model(['cover_image_id'])
+        self.env.cr.execute(
+            "SELECT c.id FROM knowledge_cover c "
+            "WHERE NOT EXISTS (SELECT 1 FROM knowledge_article a "
+            "WHERE a.cover_image_id = c.id)"
+        )
+        self.browse([row[0] for row in self.env.cr.fetchall()]).unlink()